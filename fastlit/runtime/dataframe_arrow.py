@@ -80,6 +80,52 @@ def serialize_arrow_frame(
     if not arrow_transport_available():
         return None
 
+    column_values = [
+        [row[idx] if idx < len(row) else None for row in rows]
+        for idx in range(len(columns))
+    ]
+    return serialize_arrow_columns(
+        columns=columns,
+        column_values=column_values,
+        index=index,
+        positions=positions,
+    )
+
+
+def encode_arrow_columns_base64(
+    *,
+    columns: list[dict[str, Any]],
+    column_values: list[Any],
+    index: list[Any] | None = None,
+    positions: list[int] | None = None,
+) -> str | None:
+    """Encode column-oriented data to an Arrow IPC stream as base64."""
+    payload = serialize_arrow_columns(
+        columns=columns,
+        column_values=column_values,
+        index=index,
+        positions=positions,
+    )
+    if payload is None:
+        return None
+    return base64.b64encode(payload).decode("ascii")
+
+
+def serialize_arrow_columns(
+    *,
+    columns: list[dict[str, Any]],
+    column_values: list[Any],
+    index: list[Any] | None = None,
+    positions: list[int] | None = None,
+) -> bytes | None:
+    """Serialize column-oriented data into an Arrow IPC byte stream.
+
+    Each entry of ``column_values`` is either a list of JSON-safe values or
+    a pandas Series, which pyarrow converts straight from its buffers.
+    """
+    if not arrow_transport_available():
+        return None
+
     try:
         import pyarrow as pa
         import pyarrow.ipc as ipc
@@ -89,8 +135,7 @@ def serialize_arrow_frame(
     column_names = [str(column.get("name", "")) for column in columns]
     arrays: dict[str, Any] = {}
 
-    for idx, name in enumerate(column_names):
-        values = [row[idx] if idx < len(row) else None for row in rows]
+    for name, values in zip(column_names, column_values):
         arrays[name] = _build_arrow_array(pa, values)
 
     if index is not None:
@@ -108,7 +153,42 @@ def serialize_arrow_frame(
         return None
 
 
-def _build_arrow_array(pa: Any, values: list[Any]) -> Any:
+def rows_to_typed_pandas(
+    *,
+    rows: list[list[Any]],
+    names: list[str],
+    dtypes: list[Any],
+) -> Any | None:
+    """Build a pandas DataFrame from rows with fixed numpy column dtypes.
+
+    Each column is converted by pyarrow straight to its target type. Returns
+    None when pyarrow is missing, a row is ragged, or a value doesn't fit its
+    column type, so callers can fall back to a lenient conversion.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return None
+
+    width = len(names)
+    if any(len(row) != width for row in rows):
+        return None
+    columns = list(zip(*rows)) if rows else [()] * width
+    try:
+        types = [pa.from_numpy_dtype(dtype) for dtype in dtypes]
+        arrays = [pa.array(values, type=type_) for values, type_ in zip(columns, types)]
+        return pa.Table.from_arrays(arrays, names=names).to_pandas()
+    except (pa.ArrowException, TypeError, ValueError, OverflowError):
+        return None
+
+
+def _build_arrow_array(pa: Any, values: Any) -> Any:
+    if not isinstance(values, list):
+        # pandas Series: missing values (NaN/NA) become Arrow nulls.
+        try:
+            return pa.array(values, from_pandas=True)
+        except Exception:
+            values = values.tolist()
     try:
         return pa.array(values)
     except Exception:
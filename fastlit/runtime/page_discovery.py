@@ -276,14 +276,49 @@ def _sort_key(page: DiscoveredPage) -> tuple[int, int, int, int, int, int, str]:
     )
 
 
+# Last discovery per entry script, with the file signature it was built from.
+_discovery_cache: dict[Path, tuple[tuple[tuple[str, int, int], ...], list[DiscoveredPage]]] = {}
+
+
+def _discovery_signature(*roots: Path) -> tuple[tuple[str, int, int], ...]:
+    """``(path, mtime_ns, size)`` of every ``*.py`` file under *roots*."""
+    entries: list[tuple[str, int, int]] = []
+    for root in roots:
+        if not root.is_dir():
+            continue
+        for path in root.rglob("*.py"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((str(path), stat.st_mtime_ns, stat.st_size))
+    entries.sort()
+    return tuple(entries)
+
+
 def discover_pages(entry_script_path: str | Path) -> list[DiscoveredPage]:
-    """Discover pages from a sibling ``pages/`` directory."""
+    """Discover pages from a sibling ``pages/`` directory.
+
+    ``st.navigation()`` calls this on every rerun, so results are reused
+    until a page or layout file is added, removed or modified; only the
+    ``stat`` calls are repeated, not the reads and parses of each file.
+    """
     entry_path = Path(entry_script_path).resolve()
     pages_dir = entry_path.parent / "pages"
     layouts_dir = entry_path.parent / "layouts"
     if not pages_dir.is_dir():
         return []
 
+    signature = _discovery_signature(pages_dir, layouts_dir)
+    cached = _discovery_cache.get(entry_path)
+    if cached is not None and cached[0] == signature:
+        return list(cached[1])
+    definitions = _scan_pages(pages_dir, layouts_dir)
+    _discovery_cache[entry_path] = (signature, definitions)
+    return list(definitions)
+
+
+def _scan_pages(pages_dir: Path, layouts_dir: Path) -> list[DiscoveredPage]:
     definitions: list[DiscoveredPage] = []
     for path in sorted(pages_dir.rglob("*.py")):
         relative_path = path.relative_to(pages_dir)
@@ -99,6 +99,12 @@ class Session:
         # Used for cases where incremental patching can be inconsistent with
         # highly interactive client-side views.
         self._force_full_render_widget_ids: set[str] = set()
+        # Table widgets among those whose data is unchanged in the current
+        # run, with the data keys of the tables emitted by this run and the
+        # previous one.
+        self._table_data_unchanged_ids: set[str] = set()
+        self._table_data_keys: dict[str, tuple] = {}
+        self._previous_table_data_keys: dict[str, tuple] = {}
 
     def register_navigation_pages(
         self,
@@ -270,6 +276,7 @@ class Session:
     def run(self) -> RenderFull | RenderPatch:
         """Execute the script and return either a full render or a patch."""
         new_tree: UITree | None = None
+        previous_table_data_keys = self._table_data_keys
         for _attempt in range(max(1, self._MAX_RERUNS)):
             self._pending_browser_redirect = None
             self._sync_script_path_from_navigation()
@@ -278,6 +285,9 @@ class Session:
             self._id_counters = {}
             self._fragment_registry.clear()
             self._widget_to_fragment.clear()
+            self._table_data_unchanged_ids.clear()
+            self._previous_table_data_keys = previous_table_data_keys
+            self._table_data_keys = {}
             self._current_fragment_id = None
             self._inline_page_rendered = False
             self._inline_page_script_path = None
@@ -403,9 +413,15 @@ class Session:
         result: RenderFull | RenderPatch,
         event_ids: list[str] | tuple[str, ...],
     ) -> RenderFull | RenderPatch:
-        """Promote patch results to full renders for force-full widgets."""
+        """Promote patch results to full renders for force-full widgets.
+
+        Table widgets only force one when the run for this event changed
+        their data.
+        """
+        unchanged = self._table_data_unchanged_ids
         if not any(
-            event_id in self._force_full_render_widget_ids for event_id in event_ids
+            event_id in self._force_full_render_widget_ids and event_id not in unchanged
+            for event_id in event_ids
         ):
             return result
         if isinstance(result, RenderFull):
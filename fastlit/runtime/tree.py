@@ -7,10 +7,44 @@ import json
 from dataclasses import dataclass, field
 from typing import Any
 
-
-@dataclass
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
+
+if orjson is not None:
+    _ORJSON_HASH_OPTIONS = (
+        orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    )
+
+
+def _props_bytes(props: dict[str, Any]) -> bytes:
+    """Canonical byte encoding of node props for hashing.
+
+    Only ever compared against bytes from this same function, so the orjson
+    and stdlib encodings don't need to agree with each other.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(props, default=str, option=_ORJSON_HASH_OPTIONS)
+        except TypeError:
+            pass
+    return json.dumps(
+        props,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    ).encode("utf-8")
+
+
+@dataclass(slots=True)
 class UINode:
-    """A single node in the UI tree."""
+    """A single node in the UI tree.
+
+    Slotted: every rerun builds a node per element, so dropping the
+    per-instance ``__dict__`` saves an allocation and memory on each.
+    """
 
     type: str
     id: str
@@ -44,14 +78,7 @@ class UINode:
         hasher.update(self.id.encode("utf-8", "replace"))
         hasher.update(b"\x1f")
 
-        props_bytes = json.dumps(
-            self.props,
-            sort_keys=True,
-            separators=(",", ":"),
-            ensure_ascii=False,
-            default=str,
-        ).encode("utf-8")
-        hasher.update(props_bytes)
+        hasher.update(_props_bytes(self.props))
         hasher.update(b"\x1e")
 
         for child in self.children:
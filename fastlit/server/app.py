@@ -40,6 +40,11 @@ from fastlit.server.dataframe_store import (
 )
 from fastlit.server.websocket_handler import handle_websocket
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
+
 # Will be set by CLI before the app starts
 _script_path: str = ""
 _static_dir: str = ""
@@ -49,6 +54,25 @@ _component_paths: dict[str, str] = {}
 logger = logging.getLogger("fastlit.app")
 
 
+class _DataframeJSONResponse(JSONResponse):
+    """JSONResponse encoded with orjson when available.
+
+    Dataframe windows can hold thousands of rows; orjson encodes them in C
+    and writes NaN as null instead of rejecting it like the stdlib encoder.
+    """
+
+    def render(self, content) -> bytes:
+        if orjson is not None:
+            try:
+                return orjson.dumps(
+                    content,
+                    option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+                )
+            except TypeError:
+                pass
+        return super().render(content)
+
+
 def register_component_path(name: str, path: str) -> None:
     """Register a component's built frontend directory for static serving."""
     _component_paths[name] = path
@@ -552,7 +576,7 @@ async def dataframe_slice_endpoint(request):
                 media_type=ARROW_STREAM_MEDIA_TYPE,
                 headers=headers,
             )
-    return JSONResponse(data)
+    return _DataframeJSONResponse(data)
 
 
 def _parse_dataframe_sorts(raw: str) -> list[DataframeSort]:
@@ -26,6 +26,13 @@ try:
 except ImportError:  # pragma: no cover
     orjson = None
 
+# Let orjson encode numpy arrays/scalars (e.g. chart specs) and non-string
+# dict keys natively instead of bailing out to the much slower stdlib
+# encoder for the whole payload.
+_ORJSON_OPTIONS = (
+    orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+)
+
 logger = logging.getLogger("fastlit.ws")
 
 _MAX_QUERY_PARAMS = 64
@@ -183,7 +190,7 @@ class _SafeJSONEncoder(json.JSONEncoder):
 def _serialize_payload(payload: dict) -> tuple[str, int]:
     if orjson is not None:
         try:
-            body = orjson.dumps(payload)
+            body = orjson.dumps(payload, option=_ORJSON_OPTIONS)
             return body.decode("utf-8"), len(body)
         except TypeError:
             pass  # fall through to safe encoder
@@ -194,7 +201,7 @@ def _serialize_payload(payload: dict) -> tuple[str, int]:
 def _node_token(node: dict) -> str:
     if orjson is not None:
         try:
-            raw = orjson.dumps(node)
+            raw = orjson.dumps(node, option=_ORJSON_OPTIONS)
             return hashlib.sha1(raw).hexdigest()
         except TypeError:
             pass
@@ -301,7 +308,7 @@ def _optimize_patch_payload(
 def _estimate_json_bytes(obj: object) -> int:
     try:
         if orjson is not None:
-            return len(orjson.dumps(obj))
+            return len(orjson.dumps(obj, option=_ORJSON_OPTIONS))
         return len(json.dumps(obj, ensure_ascii=False, default=str).encode("utf-8"))
     except Exception:
         return 0
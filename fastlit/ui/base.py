@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import inspect
 import os as _os
 from typing import Any
@@ -46,7 +47,8 @@ def _emit_node(
 
     Args:
         node_type: The type string (e.g. "title", "button", "slider").
-        props: The node properties.
+        props: The node properties. Never mutated, so callers may pass
+            shared/cached dicts.
         key: Optional explicit key for ID stability.
         is_widget: If True, this node represents an interactive widget.
         no_rerun: If True, widget events won't trigger a script rerun.
@@ -113,8 +115,17 @@ def _get_user_frame() -> Any:
     """
     frame = inspect.currentframe()
     while frame is not None:
-        filepath = _os.path.abspath(frame.f_code.co_filename)
-        if not filepath.startswith(_fastlit_dir):
+        if not _is_fastlit_file(frame.f_code.co_filename):
             return frame
         frame = frame.f_back
     return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_fastlit_file(filename: str) -> bool:
+    """Whether *filename* lies inside the fastlit package (cached per file).
+
+    Every node ID walks a few frames, and normalizing each frame's path
+    dominated that walk; the set of filenames seen is small and fixed.
+    """
+    return _os.path.abspath(filename).startswith(_fastlit_dir)
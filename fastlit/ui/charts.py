@@ -9,13 +9,51 @@ Provides Streamlit-compatible chart functions:
 
 from __future__ import annotations
 
-from typing import Any, Sequence, TYPE_CHECKING
+import functools
+from typing import Any, Callable, Sequence, TYPE_CHECKING
 
 from fastlit.ui.base import _emit_node
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
+
 if TYPE_CHECKING:
     import pandas as pd
 
+_INF = float("inf")
+
+
+@functools.lru_cache(maxsize=1)
+def _pandas() -> Any:
+    """Return the pandas module, or None if it isn't installed.
+
+    Resolved on first use and cached, so hot paths don't pay for the import
+    machinery on every call and ``import fastlit`` doesn't import pandas.
+    """
+    try:
+        import pandas
+    except ImportError:
+        return None
+    return pandas
+
+
+@functools.lru_cache(maxsize=1)
+def _numpy() -> Any:
+    """Return the numpy module, or None if it isn't installed (cached)."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+# Chart-data handler per concrete input type, filled in the first time a type
+# is seen. Only types whose handler doesn't depend on the contents (DataFrame,
+# dict) are recorded; lists still need their first element inspected.
+_chart_data_handlers: dict[type, Callable[..., dict]] = {}
+
 
 def _prepare_chart_data(
     data: Any,
@@ -32,18 +70,20 @@ def _prepare_chart_data(
     - yKeys: list of y axis key names
     - series: list of series names (for multi-line)
     """
-    # Handle pandas DataFrame
-    try:
-        import pandas as pd
+    handler = _chart_data_handlers.get(type(data))
+    if handler is not None:
+        return handler(data, x=x, y=y, color=color)
 
-        if isinstance(data, pd.DataFrame):
-            return _prepare_pandas_chart(data, x=x, y=y, color=color)
-    except ImportError:
-        pass
+    # Handle pandas DataFrame
+    pd = _pandas()
+    if pd is not None and isinstance(data, pd.DataFrame):
+        _chart_data_handlers[type(data)] = _prepare_pandas_chart
+        return _prepare_pandas_chart(data, x=x, y=y, color=color)
 
     # Handle dict of lists (column-oriented)
     if isinstance(data, dict):
-        return _prepare_dict_chart(data, x=x, y=y)
+        _chart_data_handlers[type(data)] = _prepare_dict_chart
+        return _prepare_dict_chart(data, x=x, y=y, color=color)
 
     # Handle list of dicts
     if isinstance(data, list) and data and isinstance(data[0], dict):
@@ -68,15 +108,19 @@ def _prepare_pandas_chart(
     color: str | None = None,
 ) -> dict:
     """Prepare pandas DataFrame for charting."""
-    import pandas as pd  # noqa: F811 - runtime import after TYPE_CHECKING
-
     # Determine x column
     if x is None:
         # Use index as x
-        x_values = df.index.tolist()
+        index = df.index
+        if isinstance(index, _pandas().RangeIndex):
+            # Already plain ints: let zip() consume the range lazily
+            # instead of materializing the index.
+            x_values = range(index.start, index.stop, index.step)
+        else:
+            x_values = _column_to_chart_values(index)
         x_key = "index"
     else:
-        x_values = df[x].tolist()
+        x_values = _column_to_chart_values(df[x])
         x_key = x
 
     # Determine y columns
@@ -91,13 +135,14 @@ def _prepare_pandas_chart(
     else:
         y_cols = list(y)
 
-    # Build data records
-    records = []
-    for i, x_val in enumerate(x_values):
-        record = {x_key: _to_chart_value(x_val)}
-        for col in y_cols:
-            record[col] = _to_chart_value(df[col].iloc[i])
-        records.append(record)
+    # Build data records column by column, then stitch rows together
+    keys = [x_key, *y_cols]
+    columns = [x_values]
+    for col in y_cols:
+        columns.append(_column_to_chart_values(df[col]))
+    dict_ = dict
+    zip_ = zip
+    records = [dict_(zip_(keys, row)) for row in zip_(*columns)]
 
     return {
         "data": records,
@@ -111,8 +156,13 @@ def _prepare_dict_chart(
     *,
     x: str | None = None,
     y: str | Sequence[str] | None = None,
+    color: str | None = None,
 ) -> dict:
-    """Prepare dict of lists for charting."""
+    """Prepare dict of lists for charting.
+
+    ``color`` is accepted so every cached handler takes the same keywords;
+    dict data has no series column to split on.
+    """
     keys = list(data.keys())
     if not keys:
         return {"data": [], "xKey": "x", "yKeys": ["y"]}
@@ -189,28 +239,74 @@ def _prepare_list_chart(
     }
 
 
+def _column_to_chart_values(values: Any) -> list:
+    """Convert a pandas Series or Index to chart-safe values in one pass.
+
+    Dispatches once on the dtype so numeric, boolean and datetime columns
+    are converted in bulk; only object-like columns fall back to the
+    per-value ``_to_chart_value`` conversion.
+    """
+    dtype = values.dtype
+    if isinstance(dtype, _numpy().dtype) and dtype.kind in ("b", "i", "u"):
+        # Plain numpy ints/bools can't hold missing values and tolist()
+        # already boxes them to native Python scalars.
+        return values.tolist()
+
+    pd = _pandas()
+    types = pd.api.types
+
+    if types.is_bool_dtype(dtype) or (
+        types.is_numeric_dtype(dtype) and not types.is_complex_dtype(dtype)
+    ):
+        return _nullable_column_values(values)
+
+    if types.is_datetime64_any_dtype(dtype):
+        present = values.notna().tolist()
+        return [
+            value.isoformat() if ok else None
+            for value, ok in zip(values.tolist(), present)
+        ]
+
+    if isinstance(dtype, pd.StringDtype):
+        return _nullable_column_values(values)
+
+    return [_to_chart_value(value) for value in values.tolist()]
+
+
+def _nullable_column_values(values: Any) -> list:
+    """tolist() a Series/Index, mapping NaN/NA to None with one vectorized mask."""
+    if not values.hasnans:
+        return values.tolist()
+    # tolist() on an object array yields native ints/floats/bools.
+    return values.to_numpy(dtype=object, na_value=None).tolist()
+
+
 def _to_chart_value(value: Any) -> Any:
     """Convert value to chart-safe type."""
     if value is None:
         return None
 
-    # Handle pandas NA
-    try:
-        import pandas as pd
+    # Native Python values are by far the most common; check them first by
+    # exact type so the pandas/numpy probes below only see exotic values.
+    value_type = type(value)
+    if value_type is float:
+        return None if value != value else value
+    if value_type is int or value_type is str or value_type is bool:
+        return value
 
-        if pd.isna(value):
-            return None
-    except (ImportError, TypeError):
-        pass
+    # Handle pandas NA
+    pd = _pandas()
+    if pd is not None:
+        try:
+            if pd.isna(value):
+                return None
+        except TypeError:
+            pass
 
     # Handle numpy types
-    try:
-        import numpy as np
-
-        if isinstance(value, (np.integer, np.floating)):
-            return value.item()
-    except ImportError:
-        pass
+    np = _numpy()
+    if np is not None and isinstance(value, (np.integer, np.floating)):
+        return value.item()
 
     # Handle datetime
     if hasattr(value, "isoformat"):
@@ -379,23 +475,24 @@ def scatter_chart(
     )
 
 
+_DEFAULT_COLORS = (
+    "#8884d8",
+    "#82ca9d",
+    "#ffc658",
+    "#ff7300",
+    "#00C49F",
+    "#FFBB28",
+    "#FF8042",
+    "#0088FE",
+)
+
+
 def _normalize_colors(
     color: str | Sequence[str] | None, count: int
 ) -> list[str]:
     """Normalize color input to list of colors."""
-    default_colors = [
-        "#8884d8",
-        "#82ca9d",
-        "#ffc658",
-        "#ff7300",
-        "#00C49F",
-        "#FFBB28",
-        "#FF8042",
-        "#0088FE",
-    ]
-
     if color is None:
-        return default_colors[:count]
+        return list(_DEFAULT_COLORS[:count])
     if isinstance(color, str):
         return [color] * count
     return list(color)[:count]
@@ -458,52 +555,78 @@ def _prepare_map_data(
     lat_col = latitude
     lon_col = longitude
 
-    try:
-        import pandas as pd
-
-        if isinstance(data, pd.DataFrame):
-            cols = data.columns.tolist()
-
-            if lat_col is None:
-                for c in ["lat", "latitude", "LAT", "Latitude"]:
-                    if c in cols:
-                        lat_col = c
-                        break
-
-            if lon_col is None:
-                for c in ["lon", "lng", "longitude", "LON", "Longitude"]:
-                    if c in cols:
-                        lon_col = c
-                        break
-
-            if lat_col and lon_col:
+    pd = _pandas()
+    if pd is not None and isinstance(data, pd.DataFrame):
+        cols = data.columns.tolist()
+
+        if lat_col is None:
+            for c in ["lat", "latitude", "LAT", "Latitude"]:
+                if c in cols:
+                    lat_col = c
+                    break
+
+        if lon_col is None:
+            for c in ["lon", "lng", "longitude", "LON", "Longitude"]:
+                if c in cols:
+                    lon_col = c
+                    break
+
+        if lat_col and lon_col:
+            np = _numpy()
+            try:
+                lats = data[lat_col].to_numpy(dtype="float64", na_value=np.nan)
+                lons = data[lon_col].to_numpy(dtype="float64", na_value=np.nan)
+            except (TypeError, ValueError):
+                # Mixed/object columns numpy can't cast: convert per row,
+                # using itertuples to avoid building a Series per row.
                 points = []
-                for _, row in data.iterrows():
-                    lat = row.get(lat_col)
-                    lon = row.get(lon_col)
-                    if lat is not None and lon is not None:
-                        points.append({
-                            "lat": float(lat),
-                            "lon": float(lon),
-                        })
+                rows = data[[lat_col, lon_col]].itertuples(index=False, name=None)
+                for lat, lon in rows:
+                    if lat is None or lon is None:
+                        continue
+                    lat = float(lat)
+                    lon = float(lon)
+                    if lat == lat and lon == lon:
+                        points.append({"lat": lat, "lon": lon})
                 return points
-    except ImportError:
-        pass
+            mask = ~(np.isnan(lats) | np.isnan(lons))
+            return [
+                {"lat": lat, "lon": lon}
+                for lat, lon in zip(lats[mask].tolist(), lons[mask].tolist())
+            ]
 
     # Handle list of dicts
     if isinstance(data, list):
+        lat_keys = (lat_col or "lat", "latitude")
+        lon_keys = (lon_col or "lon", "longitude", "lng")
+        # Resolve which key holds lat/lon once and only re-probe when a row
+        # doesn't carry it, so homogeneous rows cost one lookup per axis.
+        lat_key = lon_key = None
         points = []
+        append = points.append
         for row in data:
-            if isinstance(row, dict):
-                lat = row.get(lat_col or "lat") or row.get("latitude")
-                lon = row.get(lon_col or "lon") or row.get("longitude") or row.get("lng")
-                if lat is not None and lon is not None:
-                    points.append({"lat": float(lat), "lon": float(lon)})
+            if not isinstance(row, dict):
+                continue
+            if lat_key not in row:
+                lat_key = _first_present_key(row, lat_keys)
+            if lon_key not in row:
+                lon_key = _first_present_key(row, lon_keys)
+            lat = row.get(lat_key)
+            lon = row.get(lon_key)
+            if lat is not None and lon is not None:
+                append({"lat": float(lat), "lon": float(lon)})
         return points
 
     return []
 
 
+def _first_present_key(row: dict, candidates: tuple[str, ...]) -> str | None:
+    for key in candidates:
+        if key in row:
+            return key
+    return None
+
+
 # ---------------------------------------------------------------------------
 # External Library Charts
 # ---------------------------------------------------------------------------
@@ -565,9 +688,7 @@ def _plotly_to_spec(figure_or_data: Any) -> dict:
     """Convert Plotly figure to JSON spec."""
     # Handle Plotly Figure object
     if hasattr(figure_or_data, "to_json"):
-        import json
-
-        return json.loads(figure_or_data.to_json())
+        return _plotly_figure_to_spec(figure_or_data)
 
     # Handle dict (already a spec)
     if isinstance(figure_or_data, dict):
@@ -643,6 +764,58 @@ def vega_lite_chart(
     )
 
 
+def _plotly_figure_to_spec(figure: Any) -> dict:
+    # to_plotly_json() hands back the figure dict directly, skipping the
+    # serialize + parse round-trip; it may still hold numpy arrays or
+    # datetimes, which _to_spec_value normalizes.
+    if hasattr(figure, "to_plotly_json"):
+        try:
+            return _to_spec_value(figure.to_plotly_json())
+        except TypeError:
+            pass
+
+    if orjson is not None:
+        try:
+            return orjson.loads(figure.to_json(engine="orjson"))
+        except (TypeError, ValueError):
+            pass
+
+    import json
+
+    return json.loads(figure.to_json())
+
+
+def _to_spec_value(value: Any) -> Any:
+    """Recursively convert a figure dict to plain JSON-compatible values.
+
+    Raises TypeError on values with no obvious JSON form so callers can
+    fall back to the library's own JSON encoder.
+    """
+    if value is None or isinstance(value, (str, bool, int)):
+        return value
+    if isinstance(value, float):
+        return value if value == value and value not in (_INF, -_INF) else None
+    if isinstance(value, dict):
+        return {key: _to_spec_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_spec_value(item) for item in value]
+
+    tolist = getattr(value, "tolist", None)
+    dtype = getattr(value, "dtype", None)
+    if tolist is not None and dtype is not None:
+        # numpy arrays and scalars; datetime64/complex go through the fallback
+        kind = getattr(dtype, "kind", None)
+        if kind in ("b", "i", "u"):
+            return tolist()
+        if kind in ("f", "O", "U"):
+            return _to_spec_value(tolist())
+
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+
+    raise TypeError(f"Unsupported value in figure spec: {type(value).__name__}")
+
+
 def _altair_to_spec(chart: Any) -> dict:
     """Convert Altair chart to Vega-Lite spec."""
     if hasattr(chart, "to_dict"):
@@ -652,13 +825,13 @@ def _altair_to_spec(chart: Any) -> dict:
 
 def _data_to_values(data: Any) -> list[dict]:
     """Convert data to list of records for Vega-Lite."""
-    try:
-        import pandas as pd
-
-        if isinstance(data, pd.DataFrame):
-            return data.to_dict(orient="records")
-    except ImportError:
-        pass
+    pd = _pandas()
+    if pd is not None and isinstance(data, pd.DataFrame):
+        # Column-wise tolist() boxes to native Python scalars in bulk,
+        # which is much cheaper than to_dict(orient="records").
+        keys = data.columns.tolist()
+        columns = [data.iloc[:, i].tolist() for i in range(len(keys))]
+        return [dict(zip(keys, row)) for row in zip(*columns)]
 
     if isinstance(data, list):
         return data
@@ -669,10 +842,13 @@ def _data_to_values(data: Any) -> list[dict]:
         if not keys:
             return []
         length = len(data[keys[0]]) if isinstance(data[keys[0]], list) else 1
-        return [
-            {k: (data[k][i] if isinstance(data[k], list) else data[k]) for k in keys}
-            for i in range(length)
+        columns = [
+            value if isinstance(value, list) else [value] * length
+            for value in data.values()
         ]
+        dict_ = dict
+        zip_ = zip
+        return [dict_(zip_(keys, row)) for row in zip_(*columns)]
 
     return []
 
@@ -707,8 +883,9 @@ def pyplot(
         # Render to PNG
         buf = io.BytesIO()
         fig.savefig(buf, format="png", bbox_inches="tight", dpi=150)
-        buf.seek(0)
-        img_base64 = base64.b64encode(buf.read()).decode("utf-8")
+        # Encode straight from the buffer's memory instead of copying it out.
+        with buf.getbuffer() as png:
+            image = "data:image/png;base64," + base64.b64encode(png).decode("ascii")
 
         if clear_figure:
             plt.clf()
@@ -716,7 +893,7 @@ def pyplot(
         _emit_node(
             "pyplot",
             {
-                "image": f"data:image/png;base64,{img_base64}",
+                "image": image,
                 "useContainerWidth": use_container_width,
             },
             key=key,
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
+import functools
 from typing import Any, Callable
 
 from fastlit.runtime.context import get_current_session
 from fastlit.runtime.tree import UINode
 from fastlit.ui.base import _emit_node, _make_id
+from fastlit.ui.layout import _ContainerProxy
 from fastlit.ui.text import _live_text_props
 
 
-class ChatMessage:
+class ChatMessage(_ContainerProxy):
     """Context manager for a chat message bubble.
 
     Usage::
@@ -19,41 +21,7 @@ class ChatMessage:
             st.write("Hello!")
     """
 
-    def __init__(self, node: UINode) -> None:
-        self._node = node
-
-    @staticmethod
-    def _is_attached(root: UINode, target: UINode) -> bool:
-        stack = [root]
-        while stack:
-            node = stack.pop()
-            if node is target:
-                return True
-            stack.extend(node.children)
-        return False
-
-    def __enter__(self):
-        session = get_current_session()
-        tree = session.current_tree
-        if not self._is_attached(tree.root, self._node):
-            tree.append(self._node)
-        tree.push_container(self._node)
-        return self
-
-    def __exit__(self, *args):
-        get_current_session().current_tree.pop_container()
-
-    def __getattr__(self, name: str):
-        import fastlit as st
-
-        func = getattr(st, name, None)
-        if func is None:
-            raise AttributeError(f"ChatMessage has no attribute '{name}'")
-
-        def wrapper(*a, **kw):
-            with self:
-                return func(*a, **kw)
-        return wrapper
+    _name = "ChatMessage"
 
 
 def chat_message(
@@ -84,6 +52,22 @@ def chat_message(
     return ChatMessage(node)
 
 
+@functools.lru_cache(maxsize=256)
+def _chat_input_props(
+    placeholder: str | None, max_chars: int | None, disabled: bool
+) -> dict[str, Any]:
+    """Build (and memoize) chat_input props for a given argument shape.
+
+    The returned dict is shared between calls; it is safe to hand to
+    _emit_node because _emit_node never mutates the props it receives.
+    """
+    return {
+        **_live_text_props("placeholder", placeholder),
+        "maxChars": max_chars,
+        "disabled": disabled,
+    }
+
+
 def chat_input(
     placeholder: str = "Type a message...",
     *,
@@ -112,11 +96,9 @@ def chat_input(
     """
     node = _emit_node(
         "chat_input",
-        {
-            **_live_text_props("placeholder", placeholder),
-            "maxChars": max_chars,
-            "disabled": disabled,
-        },
+        _chat_input_props(
+            None if placeholder is None else str(placeholder), max_chars, disabled
+        ),
         key=key,
         is_widget=True,
     )
@@ -30,13 +30,29 @@ Usage:
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import functools
+from dataclasses import dataclass, field, fields
 from typing import Any
 
+# Attributes whose JSON key isn't simply the camelCased attribute name.
+_JSON_KEY_OVERRIDES = {"min_value": "min", "max_value": "max"}
 
-@dataclass
+
+def _json_key(name: str) -> str:
+    override = _JSON_KEY_OVERRIDES.get(name)
+    if override is not None:
+        return override
+    head, *rest = name.split("_")
+    return head + "".join(part.capitalize() for part in rest)
+
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class Column:
-    """Base column configuration."""
+    """Base column configuration.
+
+    Instances are immutable so their serialized form can be reused across
+    reruns.
+    """
 
     label: str | None = None
     width: str | None = None  # "small", "medium", "large", or pixels
@@ -52,253 +68,171 @@ class Column:
     validate_message: str | None = None
     validate_on: str | None = None
 
+    _TYPE = "default"
+
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        return {
-            "type": "default",
-            "label": self.label,
-            "width": self.width,
-            "resizable": self.resizable,
-            "minWidth": self.min_width,
-            "maxWidth": self.max_width,
-            "pinned": self.pinned,
-            "help": self.help,
-            "disabled": self.disabled,
-            "required": self.required,
-            "default": self.default,
-            "hidden": self.hidden,
-            "validateMessage": self.validate_message,
-            "validateOn": self.validate_on,
-        }
+        data = {"type": self._TYPE}
+        for name, key in _json_fields(type(self)):
+            data[key] = getattr(self, name)
+        return data
 
 
-@dataclass
+@functools.lru_cache(maxsize=None)
+def _json_fields(cls: type[Column]) -> tuple[tuple[str, str], ...]:
+    """``(attribute, JSON key)`` pairs of ``cls``'s fields, in field order."""
+    return tuple((f.name, _json_key(f.name)) for f in fields(cls))
+
+
+@dataclass(frozen=True, slots=True)
 class TextColumn(Column):
     """Text column configuration."""
 
+    _TYPE = "text"
+
     max_chars: int | None = None
     validate: str | None = None  # Regex pattern
 
-    def to_dict(self) -> dict:
-        d = super().to_dict()
-        d["type"] = "text"
-        d["maxChars"] = self.max_chars
-        d["validate"] = self.validate
-        return d
-
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NumberColumn(Column):
     """Number column configuration."""
 
+    _TYPE = "number"
+
     min_value: float | None = None
     max_value: float | None = None
     step: float | None = None
     format: str | None = None  # e.g., "%.2f", "$%.2f"
 
-    def to_dict(self) -> dict:
-        d = super().to_dict()
-        d["type"] = "number"
-        d["min"] = self.min_value
-        d["max"] = self.max_value
-        d["step"] = self.step
-        d["format"] = self.format
-        return d
-
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CheckboxColumn(Column):
     """Checkbox/boolean column configuration."""
 
-    def to_dict(self) -> dict:
-        d = super().to_dict()
-        d["type"] = "checkbox"
-        return d
+    _TYPE = "checkbox"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SelectboxColumn(Column):
     """Selectbox/dropdown column configuration."""
 
-    options: list[str] = field(default_factory=list)
+    _TYPE = "selectbox"
 
-    def to_dict(self) -> dict:
-        d = super().to_dict()
-        d["type"] = "selectbox"
-        d["options"] = self.options
-        return d
+    options: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DateColumn(Column):
     """Date column configuration."""
 
+    _TYPE = "date"
+
     min_value: str | None = None  # ISO date string
     max_value: str | None = None
     format: str | None = None  # e.g., "YYYY-MM-DD"
 
-    def to_dict(self) -> dict:
-        d = super().to_dict()
-        d["type"] = "date"
-        d["min"] = self.min_value
-        d["max"] = self.max_value
-        d["format"] = self.format
-        return d
-
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TimeColumn(Column):
     """Time column configuration."""
 
+    _TYPE = "time"
+
     min_value: str | None = None
     max_value: str | None = None
     format: str | None = None  # e.g., "HH:mm"
     step: int | None = None  # Step in seconds
 
-    def to_dict(self) -> dict:
-        d = super().to_dict()
-        d["type"] = "time"
-        d["min"] = self.min_value
-        d["max"] = self.max_value
-        d["format"] = self.format
-        d["step"] = self.step
-        return d
-
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DatetimeColumn(Column):
     """Datetime column configuration."""
 
+    _TYPE = "datetime"
+
     min_value: str | None = None
     max_value: str | None = None
     format: str | None = None
     timezone: str | None = None
 
-    def to_dict(self) -> dict:
-        d = super().to_dict()
-        d["type"] = "datetime"
-        d["min"] = self.min_value
-        d["max"] = self.max_value
-        d["format"] = self.format
-        d["timezone"] = self.timezone
-        return d
-
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProgressColumn(Column):
     """Progress bar column configuration."""
 
+    _TYPE = "progress"
+
     min_value: float = 0
     max_value: float = 100
     format: str | None = None  # e.g., "%.0f%%"
 
-    def to_dict(self) -> dict:
-        d = super().to_dict()
-        d["type"] = "progress"
-        d["min"] = self.min_value
-        d["max"] = self.max_value
-        d["format"] = self.format
-        return d
-
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LinkColumn(Column):
     """Link/URL column configuration."""
 
+    _TYPE = "link"
+
     display_text: str | None = None  # Static text or column name for dynamic text
     validate: str | None = None  # URL validation regex
 
-    def to_dict(self) -> dict:
-        d = super().to_dict()
-        d["type"] = "link"
-        d["displayText"] = self.display_text
-        d["validate"] = self.validate
-        return d
-
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ImageColumn(Column):
     """Image column configuration."""
 
-    def to_dict(self) -> dict:
-        d = super().to_dict()
-        d["type"] = "image"
-        return d
+    _TYPE = "image"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LineChartColumn(Column):
     """Sparkline/line chart column configuration."""
 
+    _TYPE = "line_chart"
+
     y_min: float | None = None
     y_max: float | None = None
 
-    def to_dict(self) -> dict:
-        d = super().to_dict()
-        d["type"] = "line_chart"
-        d["yMin"] = self.y_min
-        d["yMax"] = self.y_max
-        return d
-
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BarChartColumn(Column):
     """Bar chart column configuration."""
 
+    _TYPE = "bar_chart"
+
     y_min: float | None = None
     y_max: float | None = None
 
-    def to_dict(self) -> dict:
-        d = super().to_dict()
-        d["type"] = "bar_chart"
-        d["yMin"] = self.y_min
-        d["yMax"] = self.y_max
-        return d
-
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ListColumn(Column):
     """List column configuration (for array values)."""
 
-    def to_dict(self) -> dict:
-        d = super().to_dict()
-        d["type"] = "list"
-        return d
+    _TYPE = "list"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MultiselectColumn(Column):
     """Multiselect column configuration."""
 
-    options: list[str] = field(default_factory=list)
+    _TYPE = "multiselect"
 
-    def to_dict(self) -> dict:
-        d = super().to_dict()
-        d["type"] = "multiselect"
-        d["options"] = self.options
-        return d
+    options: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class JSONColumn(Column):
     """JSON/object column configuration."""
 
-    def to_dict(self) -> dict:
-        d = super().to_dict()
-        d["type"] = "json"
-        return d
+    _TYPE = "json"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AreaChartColumn(Column):
     """Sparkline/area chart column configuration."""
 
+    _TYPE = "area_chart"
+
     y_min: float | None = None
     y_max: float | None = None
-
-    def to_dict(self) -> dict:
-        d = super().to_dict()
-        d["type"] = "area_chart"
-        d["yMin"] = self.y_min
-        d["yMax"] = self.y_max
-        return d
@@ -2,8 +2,44 @@
 
 from __future__ import annotations
 
+import functools
+from types import MappingProxyType
+from typing import Any, Mapping
+
 from fastlit.runtime.context import get_current_session
 
+_EMPTY_MAPPING: Mapping[str, str] = MappingProxyType({})
+
+
+def _readonly_session_mapping(session: Any, attr: str, cache_attr: str) -> Mapping[str, str]:
+    """Return a read-only view of ``session.<attr>``, cached on the session.
+
+    The view is rebuilt only when the underlying mapping object changes.
+    """
+    raw = getattr(session, attr, None)
+    if not raw:
+        return _EMPTY_MAPPING
+    cached = getattr(session, cache_attr, None)
+    if cached is not None and cached[0] is raw:
+        return cached[1]
+    try:
+        view = MappingProxyType(raw)
+    except TypeError:
+        view = MappingProxyType(dict(raw))
+    try:
+        setattr(session, cache_attr, (raw, view))
+    except AttributeError:
+        pass
+    return view
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_primary_lang(accept_language: str) -> str | None:
+    """Return the primary language tag of an Accept-Language header."""
+    if not accept_language:
+        return None
+    return accept_language.split(",")[0].split(";")[0].strip()
+
 
 class _ContextProxy:
     """Exposes request context info: headers, cookies, locale, etc.
@@ -15,16 +51,20 @@ class _ContextProxy:
         return get_current_session()
 
     @property
-    def headers(self) -> dict[str, str]:
-        """HTTP headers from the WebSocket connection."""
+    def headers(self) -> Mapping[str, str]:
+        """HTTP headers from the WebSocket connection (read-only)."""
         session = self._get_session()
-        return dict(getattr(session, "request_headers", {}))
+        return _readonly_session_mapping(
+            session, "request_headers", "_context_headers_view"
+        )
 
     @property
-    def cookies(self) -> dict[str, str]:
-        """Cookies from the WebSocket connection."""
+    def cookies(self) -> Mapping[str, str]:
+        """Cookies from the WebSocket connection (read-only)."""
         session = self._get_session()
-        return dict(getattr(session, "request_cookies", {}))
+        return _readonly_session_mapping(
+            session, "request_cookies", "_context_cookies_view"
+        )
 
     @property
     def ip_address(self) -> str | None:
@@ -35,12 +75,7 @@ class _ContextProxy:
     @property
     def locale(self) -> str | None:
         """Locale from Accept-Language header."""
-        headers = self.headers
-        accept_lang = headers.get("accept-language", "")
-        if accept_lang:
-            # Return primary language tag
-            return accept_lang.split(",")[0].split(";")[0].strip()
-        return None
+        return _parse_primary_lang(self.headers.get("accept-language", ""))
 
     @property
     def timezone(self) -> str | None:
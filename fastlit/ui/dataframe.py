@@ -2,22 +2,63 @@
 
 from __future__ import annotations
 
+import datetime
+import functools
+import hashlib
 import json
 import os
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from itertools import chain, groupby, repeat, zip_longest
+from operator import ge, gt, itemgetter, le, lt
 from typing import Any, Callable, Iterable
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
+
 from fastlit.runtime.dataframe_arrow import (
     arrow_transport_available,
     default_arrow_min_rows,
     default_arrow_preview_rows,
+    encode_arrow_columns_base64,
     encode_arrow_frame_base64,
+    rows_to_typed_pandas,
 )
 from fastlit.server.dataframe_store import DataframeFilter, DataframeQuery, DataframeSort
 from fastlit.ui.base import _emit_node
+from fastlit.ui.column_config import Column
 from fastlit.ui.text import _live_text_props
 
 
+@functools.lru_cache(maxsize=1)
+def _pandas() -> Any:
+    """Return the pandas module, or None if it isn't installed.
+
+    Resolved on first use and cached, so serialization paths don't go
+    through the import machinery on every call.
+    """
+    try:
+        import pandas
+    except ImportError:
+        return None
+    return pandas
+
+
+@functools.lru_cache(maxsize=1)
+def _numpy() -> Any:
+    """Return the numpy module, or None if it isn't installed (cached)."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
 class _AttrDict(dict):
     """Dict-like object with attribute access."""
 
@@ -248,6 +289,18 @@ def dataframe(
             default_arrow_preview_rows(_default_dataframe_window_size()),
         )
     initial_query_result = None
+    arrow_view = None
+    column_data = None
+    row_window = None
+    data_key = None
+    pd = _pandas()
+    if (
+        on_query is None
+        and on_select not in {None, "ignore"}
+        and pd is not None
+        and isinstance(data, pd.DataFrame)
+    ):
+        data_key = _pandas_preview_fingerprint(data, hide_index_value, preview_max_rows)
     if on_query is not None:
         initial_query_result = _load_initial_query_result(
             on_query=on_query,
@@ -261,9 +314,27 @@ def dataframe(
             column_config=column_config,
         )
     else:
-        columns, rows, index, total_rows, truncated = _serialize_dataframe_preview(
-            data, hide_index_value, preview_max_rows
-        )
+        if use_arrow_transport and pd is not None and isinstance(data, pd.DataFrame):
+            # The preview is encoded to Arrow straight from the frame below;
+            # rows are only serialized if that doesn't happen.
+            arrow_view, total_rows, truncated = _pandas_view(data, preview_max_rows)
+            columns = _pandas_column_meta(arrow_view, list(arrow_view.dtypes))
+            rows = None
+            index = None if hide_index_value else _index_to_json_safe(arrow_view.index)
+        elif (
+            pd is not None
+            and isinstance(data, pd.DataFrame)
+            and len(data.columns)
+            and _dataframe_columnar_enabled()
+        ):
+            columns, column_data, index, total_rows, truncated = _serialize_pandas_columnar(
+                data, hide_index_value, max_rows=preview_max_rows
+            )
+            rows = None
+        else:
+            columns, rows, index, total_rows, truncated, row_window = _serialize_dataframe_preview(
+                data, hide_index_value, preview_max_rows, content_key=data_key
+            )
     columns, index_names = _coerce_index_metadata(columns, data)
     normalized_column_order = _normalize_column_order(columns, column_order)
     serialized_column_config, index_config = _serialize_column_config(
@@ -279,6 +350,12 @@ def dataframe(
     if index_config.get("hidden"):
         hide_index_value = True
         index = None
+    if arrow_view is not None:
+        preview_row_count = len(arrow_view)
+    elif column_data is not None:
+        preview_row_count = min(total_rows, preview_max_rows)
+    else:
+        preview_row_count = len(rows)
     source_id = _maybe_register_server_source(
         data=data,
         columns=columns,
@@ -286,11 +363,12 @@ def dataframe(
         index=index,
         hide_index=hide_index_value,
         total_rows=total_rows,
-        preview_rows=len(rows),
-        force=(use_arrow_transport and total_rows > len(rows)) or on_query is not None,
+        preview_rows=preview_row_count,
+        force=(use_arrow_transport and total_rows > preview_row_count) or on_query is not None,
         on_query=on_query,
         initial_query_result=initial_query_result,
         page_size=resolved_page_size,
+        row_window=row_window,
     )
 
     props = {
@@ -320,18 +398,32 @@ def dataframe(
 
     has_arrow_preview = False
     if source_id is not None and use_arrow_transport:
-        arrow_data = encode_arrow_frame_base64(
-            columns=columns,
-            rows=rows,
-            index=None if hide_index_value else index,
-            positions=list(range(len(rows))),
-        )
+        if arrow_view is not None:
+            arrow_data = encode_arrow_columns_base64(
+                columns=columns,
+                column_values=_pandas_arrow_columns(arrow_view),
+                index=None if hide_index_value else index,
+                positions=list(range(preview_row_count)),
+            )
+        else:
+            arrow_data = encode_arrow_frame_base64(
+                columns=columns,
+                rows=rows,
+                index=None if hide_index_value else index,
+                positions=list(range(len(rows))),
+            )
         if arrow_data is not None:
             has_arrow_preview = True
             props["dataTransport"] = "arrow"
             props["arrowData"] = arrow_data
             props["rows"] = []
             props.pop("index", None)
+    if column_data is not None:
+        props["rows"] = []
+        props["layout"] = "columnar"
+        props["columnData"] = column_data
+    elif props["rows"] is None:
+        props["rows"] = _pandas_rows(arrow_view, list(arrow_view.dtypes))
 
     if normalized_column_order:
         props["columnOrder"] = normalized_column_order
@@ -365,7 +457,7 @@ def dataframe(
         no_rerun=on_select == "ignore",
     )
     session = get_current_session()
-    session._force_full_render_widget_ids.add(node.id)
+    _force_full_render_on_data_change(session, node, data_key)
     selection = _normalize_selection_state(
         session.widget_store.get(node.id),
         selection_modes,
@@ -415,6 +507,9 @@ def _normalize_pagination_mode(pagination: bool | str) -> tuple[bool, str]:
     return True, mode
 
 
+# The FASTLIT_* dataframe settings in this module are read from the environment
+# once per process; call ``.cache_clear()`` on a helper to pick up a change.
+@functools.lru_cache(maxsize=1)
 def _default_max_dataframe_rows() -> int:
     """Default preview row cap for dataframe rendering."""
     try:
@@ -424,6 +519,7 @@ def _default_max_dataframe_rows() -> int:
     return max(1, value)
 
 
+@functools.lru_cache(maxsize=1)
 def _dataframe_server_paging_enabled() -> bool:
     raw = os.environ.get("FASTLIT_ENABLE_DF_SERVER_PAGING", "1")
     return raw not in {"0", "false", "False"}
@@ -484,11 +580,17 @@ def _normalize_selection_modes(selection_mode: str | Iterable[str]) -> tuple[str
 
 
 def _normalize_selection_indices(raw: Any) -> list[int]:
+    # The frontend sends a plain list of non-negative ints; skip the
+    # per-item coercion below for that shape. ``type() is int`` also
+    # rejects bools.
+    if type(raw) is list and all(type(item) is int and item >= 0 for item in raw):
+        return sorted(set(raw))
+    if isinstance(raw, str):
+        return sorted({int(part) for part in map(str.strip, raw.split(",")) if part.isdigit()})
+
     rows: list[int] = []
     seen: set[int] = set()
-    if isinstance(raw, str):
-        candidates = [part.strip() for part in raw.split(",") if part.strip()]
-    elif isinstance(raw, (list, tuple, set)):
+    if isinstance(raw, (list, tuple, set)):
         candidates = list(raw)
     else:
         candidates = [raw]
@@ -595,6 +697,7 @@ def _normalize_selection_state(
     return DataframeSelection(rows=rows, columns=columns, cells=cells)
 
 
+@functools.lru_cache(maxsize=1)
 def _default_dataframe_window_size() -> int:
     """Window size used by frontend server-side dataframe pagination."""
     try:
@@ -604,6 +707,7 @@ def _default_dataframe_window_size() -> int:
     return max(50, min(value, 5000))
 
 
+@functools.lru_cache(maxsize=1)
 def _default_dataframe_export_max_rows() -> int:
     """Maximum number of rows exported from server-backed dataframes."""
     try:
@@ -613,11 +717,19 @@ def _default_dataframe_export_max_rows() -> int:
     return max(1, value)
 
 
+@functools.lru_cache(maxsize=1)
 def _dataframe_debug_enabled() -> bool:
     raw = os.environ.get("FASTLIT_DEVTOOLS_DATAFRAME", "0")
     return raw.strip().lower() in {"1", "true", "yes", "on"}
 
 
+@functools.lru_cache(maxsize=1)
+def _dataframe_columnar_enabled() -> bool:
+    raw = os.environ.get("FASTLIT_DF_COLUMNAR", "0")
+    return raw.strip().lower() in {"1", "true", "yes", "on"}
+
+
+@functools.lru_cache(maxsize=1)
 def _editor_allows_truncation() -> bool:
     raw = os.environ.get("FASTLIT_ALLOW_TRUNCATED_EDITOR", "0")
     return raw.strip().lower() in {"1", "true", "yes", "on"}
@@ -809,18 +921,44 @@ def _coerce_index_metadata(
     columns: list[dict[str, Any]],
     data: Any,
 ) -> tuple[list[dict[str, Any]], list[str]]:
-    try:
-        import pandas as pd
-
+    pd = _pandas()
+    if pd is not None:
         raw = _coerce_tabular_data(data)
         if isinstance(raw, pd.DataFrame):
             index_names = ["" if name is None else str(name) for name in raw.index.names]
             return columns, index_names
-    except ImportError:
-        pass
     return columns, []
 
 
+_column_config_cache: dict[int, tuple[weakref.ref, dict[str, Any]]] = {}
+
+
+def _serialized_column(value: Any) -> dict[str, Any]:
+    """Return the JSON form of a column config entry.
+
+    ``Column`` instances are frozen, so their ``to_dict()`` result is
+    memoized on identity; configs declared once at module level serialize
+    only on the first rerun. The returned dict is shared and must not be
+    mutated.
+    """
+    if not isinstance(value, Column):
+        return value.to_dict() if hasattr(value, "to_dict") else dict(value)
+
+    key = id(value)
+    entry = _column_config_cache.get(key)
+    if entry is not None and entry[0]() is value:
+        return entry[1]
+
+    def _evict(ref: weakref.ref, key: int = key) -> None:
+        current = _column_config_cache.get(key)
+        if current is not None and current[0] is ref:
+            _column_config_cache.pop(key, None)
+
+    payload = value.to_dict()
+    _column_config_cache[key] = (weakref.ref(value, _evict), payload)
+    return payload
+
+
 def _serialize_column_config(
     column_config: dict | None,
     *,
@@ -835,12 +973,12 @@ def _serialize_column_config(
     column_names = [str(col.get("name", "")) for col in columns]
 
     for key, value in column_config.items():
-        payload = value.to_dict() if hasattr(value, "to_dict") else dict(value)
+        payload = _serialized_column(value)
         target_name: str | None = None
 
         if key == "_index":
             target_name = None
-            index_config = payload
+            index_config = dict(payload)
         elif isinstance(key, int):
             if 0 <= key < len(column_names):
                 target_name = column_names[key]
@@ -940,12 +1078,24 @@ def data_editor(
     callback_args = tuple(args or ())
     callback_kwargs = dict(kwargs or {})
 
-    # Convert data to serializable format
-    columns, rows, index = _serialize_dataframe(data, hide_index_value)
-    total_rows = len(rows)
+    # Convert data to serializable format. Row values of a pandas frame are
+    # serialized after the node is emitted, and only if the widget has no
+    # edited payload that would replace them anyway.
     max_rows_cap = _default_max_dataframe_rows()
     editor_allows_truncation = _editor_allows_truncation()
-    rows, index, truncated = _truncate_rows(rows, index, max_rows_cap)
+    pd = _pandas()
+    frame_view = None
+    if pd is not None and isinstance(data, pd.DataFrame):
+        total_rows = len(data)
+        truncated = total_rows > max_rows_cap
+        frame_view = data.iloc[:max_rows_cap] if truncated else data
+        columns = _pandas_column_meta(frame_view, list(frame_view.dtypes))
+        rows = []
+        index = None if hide_index_value else _index_to_json_safe(frame_view.index)
+    else:
+        columns, rows, index = _serialize_dataframe(data, hide_index_value)
+        total_rows = len(rows)
+        rows, index, truncated = _truncate_rows(rows, index, max_rows_cap)
     if truncated and not editor_allows_truncation:
         raise ValueError(
             "st.data_editor received more rows than the editable limit allows. "
@@ -1015,10 +1165,13 @@ def data_editor(
         is_widget=True,
         no_rerun=not rerun_on_change,
     )
-    session._force_full_render_widget_ids.add(node.id)
 
     # Get edited data from widget store
     stored = session.widget_store.get(node.id)
+    stored_has_rows = _editor_payload_has_rows(stored)
+    if frame_view is not None and not stored_has_rows:
+        rows = _pandas_rows(frame_view, list(frame_view.dtypes))
+        node.props["rows"] = rows
 
     if stored is not None:
         stored_rows, stored_index = _extract_editor_payload(
@@ -1032,6 +1185,13 @@ def data_editor(
         node.props["truncated"] = False
         if not hide_index_value and stored_index is not None:
             node.props["index"] = stored_index
+    # Edited payloads have no content key: they count as changed.
+    data_key = None
+    if frame_view is not None and stored is None:
+        data_key = _pandas_preview_fingerprint(data, hide_index_value, max_rows_cap)
+    _force_full_render_on_data_change(session, node, data_key)
+
+    if stored is not None:
         # Call on_change callback when data changed (A3: was silently ignored before)
         if on_change is not None:
             prev_key = f"_de_prev_{node.id}"
@@ -1043,10 +1203,10 @@ def data_editor(
                 _invoke_callback(on_change, callback_args, callback_kwargs)
         # Return edited data in original format
         edited_value = _deserialize_to_original(
-            stored,
+            stored_rows if stored_has_rows else [],
+            stored_index,
             data,
             columns=columns,
-            fallback_index=index,
             hide_index=hide_index_value,
         )
         if return_changes:
@@ -1058,6 +1218,31 @@ def data_editor(
     return data
 
 
+def _force_full_render_on_data_change(session: Any, node: Any, data_key: tuple | None) -> None:
+    """Register ``node`` for full renders, noting whether its data changed.
+
+    Events from the node always run the full session, as before. Whether
+    the resulting render goes out whole is decided for that event's run in
+    ``Session.coerce_widget_event_result``: patching a grid whose data was
+    replaced can desync the client view, but a rerun that leaves the data
+    alone (e.g. a selection change) patches fine.
+
+    ``data_key`` is the preview content key of the table's source frame
+    (see ``_pandas_preview_fingerprint``), or None when there is none; the
+    data then counts as changed. Only this small key is kept per node.
+    """
+    session._force_full_render_widget_ids.add(node.id)
+    if data_key is None:
+        session._table_data_unchanged_ids.discard(node.id)
+        return
+    fingerprint = (data_key, "index" in node.props)
+    session._table_data_keys[node.id] = fingerprint
+    if session._previous_table_data_keys.get(node.id) == fingerprint:
+        session._table_data_unchanged_ids.add(node.id)
+    else:
+        session._table_data_unchanged_ids.discard(node.id)
+
+
 def _normalize_column_order(
     columns: list[dict[str, Any]],
     column_order: list[str] | None,
@@ -1066,21 +1251,64 @@ def _normalize_column_order(
     if not column_order:
         return None
 
+    column_keys = tuple(
+        (column.get("_sourceKey", column.get("name")), str(column.get("name", "")))
+        for column in columns
+    )
+    requested = tuple(column_order)
+    try:
+        ordered = _resolve_column_order(column_keys, requested)
+    except TypeError:
+        # Unhashable labels can't be memoized; resolve directly.
+        ordered = _resolve_column_order.__wrapped__(column_keys, requested)
+    return list(ordered) or None
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_column_order(
+    column_keys: tuple[tuple[Any, str], ...],
+    column_order: tuple[Any, ...],
+) -> tuple[str, ...]:
+    """Resolve ``column_order`` against (source key, name) pairs.
+
+    Memoized because apps usually pass the same column set and order on
+    every rerun.
+    """
+    # (position, name) of the first column per source key / display name,
+    # so each requested entry resolves with two dict lookups instead of a
+    # scan over every column.
+    by_source: dict[Any, tuple[int, str]] = {}
+    by_name: dict[str, tuple[int, str]] = {}
+    for position, (source_key, current_name) in enumerate(column_keys):
+        try:
+            by_source.setdefault(source_key, (position, current_name))
+        except TypeError:
+            pass
+        by_name.setdefault(current_name, (position, current_name))
+
     seen: set[str] = set()
     ordered: list[str] = []
     for requested in column_order:
-        resolved_name: str | None = None
-        for column in columns:
-            current_name = str(column.get("name", ""))
-            source_key = column.get("_sourceKey", column.get("name"))
-            if requested == source_key or str(requested) == current_name:
-                resolved_name = current_name
-                break
+        try:
+            source_match = by_source.get(requested)
+        except TypeError:
+            source_match = None
+        name_match = by_name.get(str(requested))
+        if source_match is None or (name_match is not None and name_match < source_match):
+            source_match = name_match
+        resolved_name = source_match[1] if source_match is not None else None
         if resolved_name and resolved_name not in seen:
             ordered.append(resolved_name)
             seen.add(resolved_name)
 
-    return ordered or None
+    return tuple(ordered)
+
+
+def _editor_payload_has_rows(stored: Any) -> bool:
+    """Whether ``_extract_editor_payload`` would take rows from ``stored``."""
+    if isinstance(stored, dict):
+        return isinstance(stored.get("rows"), list)
+    return isinstance(stored, list)
 
 
 def _extract_editor_payload(
@@ -1152,65 +1380,105 @@ def _extract_editor_changes(
 
 
 def _deserialize_to_original(
-    stored: Any,
+    edited_rows: list[list[Any]],
+    edited_index: list[Any] | None,
     original: Any,
     *,
     columns: list[dict[str, Any]],
-    fallback_index: list[Any] | None,
     hide_index: bool,
 ) -> Any:
-    """Convert stored edited data back to the original input shape."""
-    edited_rows, edited_index = _extract_editor_payload(
-        stored,
-        fallback_rows=[],
-        fallback_index=fallback_index,
-        hide_index=hide_index,
-    )
-    col_names = [c["name"] for c in columns]
+    """Convert edited rows back to the original input shape.
 
-    try:
-        import pandas as pd
+    Takes the rows and index already normalized by ``_extract_editor_payload``.
+    """
+    col_names = [c["name"] for c in columns]
 
-        if isinstance(original, pd.DataFrame):
-            edited_df = pd.DataFrame(edited_rows, columns=col_names)
+    pd = _pandas()
+    if pd is not None and isinstance(original, pd.DataFrame):
+        edited_df = _typed_edited_frame(edited_rows, col_names, original)
+        if edited_df is None:
+            edited_df = _object_rows_frame(edited_rows, col_names)
             edited_df = _restore_pandas_dtypes(edited_df, original)
-            if not hide_index:
-                edited_df.index = _restore_index_values(
-                    edited_index,
-                    original.index.tolist(),
-                    len(edited_df),
-                )
-            return edited_df
-    except ImportError:
-        pass
+        if not hide_index:
+            edited_df.index = _restore_index_values(
+                edited_index,
+                original.index.tolist(),
+                len(edited_df),
+            )
+        return edited_df
 
     if isinstance(original, dict):
+        # Transpose in one pass; short rows are padded with None.
+        column_values = list(zip_longest(*edited_rows))
+        missing = [None] * len(edited_rows)
         return {
-            name: [row[idx] if idx < len(row) else None for row in edited_rows]
+            name: list(column_values[idx]) if idx < len(column_values) else list(missing)
             for idx, name in enumerate(col_names)
         }
 
     if isinstance(original, list) and original and isinstance(original[0], dict):
-        return [dict(zip(col_names, row)) for row in edited_rows]
+        return list(map(dict, map(zip, repeat(col_names), edited_rows)))
 
     if isinstance(original, list):
-        return [list(row) for row in edited_rows]
+        return list(map(list, edited_rows))
+
+    return list(map(dict, map(zip, repeat(col_names), edited_rows)))
+
+
+def _object_rows_frame(rows: list[list[Any]], col_names: list[str]) -> Any:
+    """Build a DataFrame from row lists via one 2-D object array.
+
+    ``np.fromiter`` fills the block without treating list cells as nested
+    dimensions; each column's dtype is then inferred in one pass by
+    ``infer_objects``. Ragged rows keep the ``pd.DataFrame(rows)`` path,
+    which pads them.
+    """
+    pd = _pandas()
+    np = _numpy()
+    width = len(col_names)
+    if rows and width and all(len(row) == width for row in rows):
+        try:
+            block = np.fromiter(
+                chain.from_iterable(rows), dtype=object, count=len(rows) * width
+            ).reshape(len(rows), width)
+        except (TypeError, ValueError):
+            # numpy < 1.23 can't build object arrays with fromiter.
+            pass
+        else:
+            return pd.DataFrame(block, columns=col_names, copy=False).infer_objects()
+    return pd.DataFrame(rows, columns=col_names)
+
+
+def _typed_edited_frame(edited_rows: list[list[Any]], col_names: list[str], original_df: Any) -> Any | None:
+    """Rebuild an edited numeric frame through Arrow with its original dtypes.
 
-    return [dict(zip(col_names, row)) for row in edited_rows]
+    Applies when every original column has a numpy bool/int/float dtype and
+    the edited values still fit those types, which makes the per-column
+    restoration in ``_restore_pandas_dtypes`` a no-op. Returns None
+    otherwise.
+    """
+    np = _numpy()
+    dtypes = list(original_df.dtypes)
+    if [_display_column_name(col) for col in original_df.columns] != col_names:
+        return None
+    if not all(isinstance(dtype, np.dtype) and dtype.kind in "biuf" for dtype in dtypes):
+        return None
+    edited_df = rows_to_typed_pandas(rows=edited_rows, names=col_names, dtypes=dtypes)
+    if edited_df is None or list(edited_df.dtypes) != dtypes:
+        return None
+    return edited_df
 
 
 def _restore_pandas_dtypes(edited_df: Any, original_df: Any) -> Any:
     """Best-effort dtype restoration for edited pandas DataFrames."""
-    try:
-        import pandas as pd
-        from pandas.api.types import (
-            is_bool_dtype,
-            is_datetime64_any_dtype,
-            is_float_dtype,
-            is_integer_dtype,
-        )
-    except ImportError:
+    pd = _pandas()
+    if pd is None:
         return edited_df
+    types = pd.api.types
+    is_bool_dtype = types.is_bool_dtype
+    is_datetime64_any_dtype = types.is_datetime64_any_dtype
+    is_float_dtype = types.is_float_dtype
+    is_integer_dtype = types.is_integer_dtype
 
     for col_name in original_df.columns:
         if col_name not in edited_df.columns:
@@ -1220,7 +1488,7 @@ def _restore_pandas_dtypes(edited_df: Any, original_df: Any) -> Any:
 
         try:
             if is_bool_dtype(source.dtype):
-                edited_df[col_name] = target.map(_coerce_bool_value)
+                edited_df[col_name] = _coerce_bool_series(target)
                 continue
 
             if is_integer_dtype(source.dtype):
@@ -1247,21 +1515,38 @@ def _restore_pandas_dtypes(edited_df: Any, original_df: Any) -> Any:
     return edited_df
 
 
-def _coerce_bool_value(value: Any) -> Any:
-    """Normalize mixed frontend values to booleans when possible."""
-    if value is None:
-        return None
-    if isinstance(value, bool):
-        return value
-    if isinstance(value, (int, float)):
-        return bool(value)
-    if isinstance(value, str):
-        lowered = value.strip().lower()
-        if lowered in {"true", "1", "yes", "on"}:
-            return True
-        if lowered in {"false", "0", "no", "off", ""}:
-            return False
-    return bool(value)
+# Any other non-empty string is truthy, as with ``bool(value)``.
+_FALSY_STRINGS = frozenset({"false", "0", "no", "off", ""})
+
+
+def _coerce_bool_series(target: Any) -> Any:
+    """Normalize mixed frontend values in a Series to booleans, vectorized.
+
+    Strings are matched case-insensitively against the usual false
+    literals, other values go through ``bool()``, and missing values
+    become None.
+    """
+    pd = _pandas()
+    np = _numpy()
+    if target.dtype == bool:
+        return target
+
+    missing = target.isna().to_numpy()
+    filled = target.mask(missing, False) if missing.any() else target
+    values = filled.to_numpy(dtype=object).astype(bool)
+    try:
+        lowered = filled.str.strip().str.lower()
+    except AttributeError:
+        # No string values in the column.
+        pass
+    else:
+        is_str = lowered.notna().to_numpy()
+        values = np.where(is_str, ~lowered.isin(_FALSY_STRINGS).to_numpy(), values)
+
+    if missing.any():
+        values = values.astype(object)
+        values[missing] = None
+    return pd.Series(values, index=target.index, name=target.name)
 
 
 def _restore_index_values(
@@ -1297,9 +1582,20 @@ def table(
         key: Optional key for stable identity.
     """
     data = _coerce_tabular_data(data)
-    columns, rows, index = _serialize_dataframe(data, hide_index=True)
-    total_rows = len(rows)
-    rows, _, truncated = _truncate_rows(rows, None, _default_max_dataframe_rows())
+    column_data = None
+    pd = _pandas()
+    if pd is not None and isinstance(data, pd.DataFrame) and len(data.columns):
+        # Static tables are never edited or paged, so pandas data can go
+        # over the wire column by column without building rows at all.
+        columns, column_data, _, total_rows, truncated = _serialize_pandas_columnar(
+            data, hide_index=True, max_rows=_default_max_dataframe_rows()
+        )
+    if column_data is None:
+        columns, rows, index = _serialize_dataframe(data, hide_index=True)
+        total_rows = len(rows)
+        rows, _, truncated = _truncate_rows(rows, None, _default_max_dataframe_rows())
+    else:
+        rows = []
 
     props = {
         "columns": columns,
@@ -1312,14 +1608,17 @@ def table(
         "totalRows": total_rows,
         "truncated": truncated,
     }
+    if column_data is not None:
+        props["layout"] = "columnar"
+        props["columnData"] = column_data
 
     _emit_node("table", props, key=key)
 
 
 def _coerce_tabular_data(data: Any) -> Any:
     """Best-effort coercion for dataframe-like inputs supported by Streamlit."""
-    try:
-        import pandas as pd
+    pd = _pandas()
+    if pd is not None:
         try:
             from pandas.io.formats.style import Styler
         except Exception:
@@ -1331,8 +1630,6 @@ def _coerce_tabular_data(data: Any) -> Any:
             return data.to_frame()
         if isinstance(data, pd.Index):
             return data.to_frame(index=False)
-    except ImportError:
-        pass
 
     if hasattr(data, "to_pandas") and callable(getattr(data, "to_pandas")):
         try:
@@ -1351,12 +1648,12 @@ def _coerce_tabular_data(data: Any) -> Any:
             pass
 
     if hasattr(data, "__dataframe__"):
-        try:
-            import pandas as pd
-
-            return pd.api.interchange.from_dataframe(data)
-        except Exception:
-            pass
+        pd = _pandas()
+        if pd is not None:
+            try:
+                return pd.api.interchange.from_dataframe(data)
+            except Exception:
+                pass
 
     if hasattr(data, "description") and hasattr(data, "fetchall"):
         try:
@@ -1373,6 +1670,11 @@ def _coerce_tabular_data(data: Any) -> Any:
     return data
 
 
+# Serializer per concrete input type, filled in the first time a type is
+# seen so repeat calls skip the isinstance chain in _serialize_dataframe.
+_tabular_serializers: dict[type, Callable[[Any, bool], tuple[list[dict], list[list], list | None]]] = {}
+
+
 def _serialize_dataframe(
     data: Any,
     hide_index: bool = False,
@@ -1387,57 +1689,229 @@ def _serialize_dataframe(
     """
     data = _coerce_tabular_data(data)
 
-    # Try pandas DataFrame
-    try:
-        import pandas as pd
+    serializer = _tabular_serializers.get(type(data))
+    if serializer is not None:
+        return serializer(data, hide_index)
 
-        if isinstance(data, pd.DataFrame):
-            columns, rows, index, _, _ = _serialize_pandas(
-                data, hide_index, max_rows=None
-            )
-            return columns, rows, index
-    except ImportError:
-        pass
+    # Try pandas DataFrame
+    pd = _pandas()
+    if pd is not None and isinstance(data, pd.DataFrame):
+        _tabular_serializers[type(data)] = _serialize_pandas_frame
+        return _serialize_pandas_frame(data, hide_index)
 
     # Try dict of lists (column-oriented)
     if isinstance(data, dict):
+        _tabular_serializers[type(data)] = _serialize_dict_frame
         return _serialize_dict(data)
 
-    # Try list of dicts (row-oriented)
-    if isinstance(data, list) and data and isinstance(data[0], dict):
-        return _serialize_list_of_dicts(data)
-
-    # Try list of lists
+    # Try list of dicts (row-oriented) or list of lists
     if isinstance(data, list):
-        return _serialize_list_of_lists(data)
+        _tabular_serializers[type(data)] = _serialize_list_frame
+        return _serialize_list_frame(data, hide_index)
 
     # Fallback: convert to string
     return [{"name": "value", "type": "string"}], [[str(data)]], None
 
 
+def _serialize_pandas_frame(
+    data: Any, hide_index: bool
+) -> tuple[list[dict], list[list], list | None]:
+    columns, rows, index, _, _ = _serialize_pandas(data, hide_index, max_rows=None)
+    return columns, rows, index
+
+
+def _serialize_dict_frame(
+    data: dict, hide_index: bool
+) -> tuple[list[dict], list[list], list | None]:
+    return _serialize_dict(data)
+
+
+def _serialize_list_frame(
+    data: list, hide_index: bool
+) -> tuple[list[dict], list[list], list | None]:
+    if data and isinstance(data[0], dict):
+        return _serialize_list_of_dicts(data)
+    return _serialize_list_of_lists(data)
+
+
 def _serialize_dataframe_preview(
     data: Any,
     hide_index: bool,
     max_rows: int,
-) -> tuple[list[dict], list[list], list | None, int, bool]:
-    """Serialize data for display with an upper row bound."""
+    *,
+    content_key: tuple | None = None,
+) -> tuple[list[dict], list[list], list | None, int, bool, _RowWindow | None]:
+    """Serialize data for display with an upper row bound.
+
+    For non-pandas input the last element serializes any ``(start, end)``
+    window of the whole table, so server paging can read rows past the
+    preview without serializing them all up front. ``content_key`` is
+    passed on to ``_serialize_pandas_cached``.
+    """
     data = _coerce_tabular_data(data)
-    try:
-        import pandas as pd
+    pd = _pandas()
+    if pd is not None and isinstance(data, pd.DataFrame):
+        return (
+            *_serialize_pandas_cached(data, hide_index, max_rows=max_rows, key=content_key),
+            None,
+        )
 
-        if isinstance(data, pd.DataFrame):
-            return _serialize_pandas(data, hide_index, max_rows=max_rows)
-    except ImportError:
-        pass
+    lazy = _lazy_tabular_rows(data)
+    if lazy is not None:
+        columns, total_rows, row_window = lazy
+        rows, index = row_window(0, min(max_rows, total_rows))
+        return columns, rows, index, total_rows, total_rows > max_rows, row_window
+
+    columns, full_rows, full_index = _serialize_dataframe(data, hide_index)
+    total_rows = len(full_rows)
+    rows, index, truncated = _truncate_rows(full_rows, full_index, max_rows)
+    return columns, rows, index, total_rows, truncated, _materialized_window(full_rows, full_index)
+
+
+# Serializes rows ``start:end`` of a table into ``(rows, index)``.
+_RowWindow = Callable[[int, int], tuple[list[list[Any]], list[Any] | None]]
+
+
+def _lazy_tabular_rows(data: Any) -> tuple[list[dict], int, _RowWindow] | None:
+    """Columns, row count and window serializer for plain tabular data.
+
+    Covers equal-length dicts of lists and non-empty lists of dicts or rows,
+    matching what ``_serialize_dataframe`` returns for the same rows;
+    anything else returns None. The windows read shallow copies of the
+    containers, so later appends, removals or reassignments in the caller's
+    data can't desync pages from the row count taken here.
+    """
+    if isinstance(data, dict):
+        if not data or not all(isinstance(v, list) for v in data.values()):
+            return None
+        values = [list(v) for v in data.values()]
+        total_rows = len(values[0])
+        if any(len(v) != total_rows for v in values):
+            return None
+        columns = [{"name": str(k), "type": "auto"} for k in data]
+
+        def dict_window(start: int, end: int) -> tuple[list[list[Any]], list[Any] | None]:
+            cols = [list(map(_to_json_safe, v[start:end])) for v in values]
+            return list(map(list, zip(*cols))), list(range(start, min(end, total_rows)))
+
+        return columns, total_rows, dict_window
+
+    if not isinstance(data, list) or not data:
+        return None
+    data = list(data)
+    total_rows = len(data)
+    first = data[0]
+    if isinstance(first, dict):
+        all_keys = list(dict.fromkeys(k for row in data for k in row))
+
+        def dicts_window(start: int, end: int) -> tuple[list[list[Any]], list[Any] | None]:
+            return _list_of_dicts_rows(data[start:end], all_keys), list(range(start, min(end, total_rows)))
+
+        return [{"name": str(k), "type": "auto"} for k in all_keys], total_rows, dicts_window
+
+    if isinstance(first, (list, tuple)):
+        num_cols = len(first)
+
+        def lists_window(start: int, end: int) -> tuple[list[list[Any]], list[Any] | None]:
+            rows = [list(map(_to_json_safe, row)) for row in data[start:end]]
+            return rows, list(range(start, min(end, total_rows)))
+
+    else:
+        num_cols = 1
+
+        def lists_window(start: int, end: int) -> tuple[list[list[Any]], list[Any] | None]:
+            rows = [[_to_json_safe(item)] for item in data[start:end]]
+            return rows, list(range(start, min(end, total_rows)))
+
+    return [{"name": str(i), "type": "auto"} for i in range(num_cols)], total_rows, lists_window
+
+
+def _materialized_window(rows: list[list[Any]], index: list | None) -> _RowWindow:
+    """``_RowWindow`` over already serialized rows (index padded with None)."""
+
+    def window(start: int, end: int) -> tuple[list[list[Any]], list[Any] | None]:
+        window_rows = rows[start:end]
+        if index is None:
+            return window_rows, None
+        window_index = index[start:end]
+        window_index += [None] * (len(window_rows) - len(window_index))
+        return window_rows, window_index
+
+    return window
+
+
+# Recent preview serializations keyed by a content fingerprint, so reruns
+# that rebuild an identical DataFrame reuse the serialized rows. Cached
+# results are shared between renders and must not be mutated.
+_PREVIEW_CACHE_MAX_ENTRIES = 16
+_preview_cache: OrderedDict[tuple, tuple] = OrderedDict()
+_preview_cache_lock = threading.Lock()
 
-    columns, rows, index = _serialize_dataframe(data, hide_index)
-    total_rows = len(rows)
-    if total_rows > max_rows:
-        rows = rows[:max_rows]
-        if index is not None:
-            index = index[:max_rows]
-        return columns, rows, index, total_rows, True
-    return columns, rows, index, total_rows, False
+
+def _serialize_pandas_cached(
+    df: Any,
+    hide_index: bool,
+    *,
+    max_rows: int,
+    key: tuple | None = None,
+) -> tuple[list[dict], list[list], list | None, int, bool]:
+    """``_serialize_pandas`` memoized on the content of the previewed rows.
+
+    ``key`` is the frame's ``_pandas_preview_fingerprint`` for the same
+    arguments, if the caller already computed it.
+    """
+    if key is None:
+        key = _pandas_preview_fingerprint(df, hide_index, max_rows)
+    if key is None:
+        return _serialize_pandas(df, hide_index, max_rows=max_rows)
+
+    with _preview_cache_lock:
+        cached = _preview_cache.get(key)
+        if cached is not None:
+            _preview_cache.move_to_end(key)
+            return cached
+
+    result = _serialize_pandas(df, hide_index, max_rows=max_rows)
+    with _preview_cache_lock:
+        _preview_cache[key] = result
+        while len(_preview_cache) > _PREVIEW_CACHE_MAX_ENTRIES:
+            _preview_cache.popitem(last=False)
+    return result
+
+
+def _pandas_preview_fingerprint(df: Any, hide_index: bool, max_rows: int) -> tuple | None:
+    """Content key for the first ``max_rows`` rows of ``df``, or None if unsafe.
+
+    Row hashes are digested in order, so reordered rows get a new key.
+    pandas hashes object values through ``str()``, so object columns (and
+    an object index) only qualify when they hold strings; otherwise ``1``
+    and ``"1"`` would collide.
+    """
+    pd = _pandas()
+    view = df.iloc[:max_rows] if len(df) > max_rows else df
+    infer_dtype = pd.api.types.infer_dtype
+    for position, dtype in enumerate(view.dtypes):
+        if dtype == object and infer_dtype(view.iloc[:, position], skipna=True) not in ("string", "empty"):
+            return None
+    if view.index.dtype == object and infer_dtype(view.index, skipna=True) not in ("string", "empty"):
+        return None
+    try:
+        row_hashes = pd.util.hash_pandas_object(view, index=True).to_numpy()
+        labels = tuple((type(label), label) for label in view.columns)
+        hash(labels)
+    except (TypeError, ValueError):
+        return None
+    digest = hashlib.blake2b(row_hashes.tobytes(), digest_size=16).digest()
+    return (
+        digest,
+        len(df),
+        max_rows,
+        hide_index,
+        labels,
+        tuple(str(dtype) for dtype in view.dtypes),
+        str(view.index.dtype),
+        tuple(map(repr, view.index.names)),
+    )
 
 
 def _maybe_register_server_source(
@@ -1453,8 +1927,13 @@ def _maybe_register_server_source(
     on_query: Callable[[DataframeQueryRequest], DataframeQueryResult | dict[str, Any]] | None = None,
     initial_query_result: DataframeQueryResult | None = None,
     page_size: int = 25,
+    row_window: _RowWindow | None = None,
 ) -> str | None:
-    """Register a server-side source for large tables to support window fetches."""
+    """Register a server-side source for large tables to support window fetches.
+
+    ``row_window`` serializes any window of the whole table, if the caller
+    has one; otherwise truncated data is serialized again.
+    """
     if total_rows <= preview_rows and not force:
         return None
     if on_query is None and not _dataframe_server_paging_enabled():
@@ -1513,74 +1992,133 @@ def _maybe_register_server_source(
         )
 
     # Pandas path: keep raw dataframe server-side and query lazily.
-    try:
-        import pandas as pd
-
-        if isinstance(data, pd.DataFrame):
-            positioned = data.copy()
-            positioned["__fastlit_position__"] = list(range(len(data)))
-
-            def query_fn(query):
-                view = _query_pandas_dataframe(
-                    positioned,
-                    columns=columns,
-                    search=query.search,
-                    sorts=query.sorts,
-                    filters=query.filters,
-                )
-                safe_offset = max(0, min(query.offset, len(view)))
-                safe_end = min(len(view), safe_offset + query.limit)
-                sliced = view.iloc[safe_offset:safe_end]
-                raw_keys = [col.get("_sourceKey", col.get("name")) for col in columns]
-                out_rows = [
-                    [_to_json_safe(v) for v in row]
-                    for row in sliced[raw_keys].itertuples(index=False, name=None)
-                ]
-                out_index = None if hide_index else [_to_json_safe(v) for v in sliced.index.tolist()]
-                out_positions = [_to_json_safe(v) for v in sliced["__fastlit_position__"].tolist()]
-                return {
-                    "offset": safe_offset,
-                    "limit": query.limit,
-                    "totalRows": len(view),
-                    "rows": out_rows,
-                    "index": out_index,
-                    "positions": out_positions,
-                    "columns": columns,
-                }
-
-            return register_source(
+    pd = _pandas()
+    if pd is not None and isinstance(data, pd.DataFrame):
+        # Query a shallow copy whose index holds row positions: the
+        # column arrays are shared with ``data`` instead of duplicated,
+        # and the original index is looked up per window.
+        positioned = data.copy(deep=False)
+        positioned.index = pd.RangeIndex(len(data))
+        original_index = data.index
+
+        def query_fn(query):
+            view = _query_pandas_dataframe(
+                positioned,
                 columns=columns,
-                rows=None,
-                index=None,
-                slice_fn=None,
-                total_rows=total_rows,
-                query_fn=query_fn,
-                schema_version=_schema_version(columns),
+                search=query.search,
+                sorts=query.sorts,
+                filters=query.filters,
             )
-    except ImportError:
-        pass
-
-    # Generic path: rows already materialized as a list.
-    full_rows = rows
-    full_index = index if not hide_index else None
-    if total_rows > len(rows):
-        try:
-            _cols, full_rows, generic_index = _serialize_dataframe(data, hide_index)
-            full_index = generic_index if not hide_index else None
-        except Exception:
-            # Fallback to preview rows only if full serialization fails.
-            full_rows = rows
-            full_index = index if not hide_index else None
+            safe_offset = max(0, min(query.offset, len(view)))
+            safe_end = min(len(view), safe_offset + query.limit)
+            sliced = view.iloc[safe_offset:safe_end]
+            raw_keys = [col.get("_sourceKey", col.get("name")) for col in columns]
+            window = sliced[raw_keys]
+            out_rows = _pandas_rows(window, list(window.dtypes))
+            positions = sliced.index.to_numpy()
+            out_index = None if hide_index else _index_to_json_safe(original_index[positions])
+            out_positions = positions.tolist()
+            return {
+                "offset": safe_offset,
+                "limit": query.limit,
+                "totalRows": len(view),
+                "rows": out_rows,
+                "index": out_index,
+                "positions": out_positions,
+                "columns": columns,
+            }
 
-    def generic_query_fn(query):
-        queried_rows, queried_index, queried_positions = _query_materialized_rows(
+        return register_source(
             columns=columns,
-            rows=full_rows,
-            index_values=full_index,
-            search=query.search,
-            sorts=query.sorts,
-            filters=query.filters,
+            rows=None,
+            index=None,
+            slice_fn=None,
+            total_rows=total_rows,
+            query_fn=query_fn,
+            schema_version=_schema_version(columns),
         )
+
+    # Generic path: unfiltered windows are serialized on demand; the whole
+    # table is serialized once, on the first query that needs every row.
+    row_count = total_rows
+    if row_window is None:
+        all_rows, all_index = rows, index
+        if total_rows > len(rows):
+            try:
+                _cols, all_rows, all_index = _serialize_dataframe(data, hide_index)
+            except Exception:
+                # Fallback to preview rows only if full serialization fails.
+                all_rows, all_index = rows, index
+        row_count = len(all_rows)
+        row_window = _materialized_window(all_rows, all_index)
+    full_rows: list[list[Any]] = []
+    full_index: list | None = None
+    materialized = False
+
+    def materialize() -> None:
+        nonlocal full_rows, full_index, materialized
+        if not materialized:
+            full_rows, generic_index = row_window(0, row_count)
+            full_index = None if hide_index else generic_index
+            materialized = True
+
+    search_blobs: list[str] | None = None
+    query_frame = None
+    query_frame_built = False
+
+    def generic_query_fn(query):
+        if not (query.search or "").strip() and not query.sorts and not query.filters:
+            # Unfiltered window: serialize just its rows rather than
+            # running every row through the query pipeline.
+            safe_offset = max(0, min(query.offset, row_count))
+            safe_end = min(row_count, safe_offset + query.limit)
+            window_rows, window_index = row_window(safe_offset, safe_end)
+            return {
+                "offset": safe_offset,
+                "limit": query.limit,
+                "totalRows": row_count,
+                "rows": window_rows,
+                "index": None if hide_index else window_index,
+                "positions": list(range(safe_offset, safe_end)),
+                "columns": columns,
+            }
+
+        nonlocal search_blobs, query_frame, query_frame_built
+        materialize()
+        if not query_frame_built:
+            # Built on the first query and reused for the source's lifetime.
+            query_frame = _generic_query_frame(full_rows)
+            query_frame_built = True
+        queried_positions = None
+        if query_frame is not None:
+            queried_positions = _query_generic_frame(
+                query_frame,
+                columns=columns,
+                search=query.search,
+                sorts=query.sorts,
+                filters=query.filters,
+            )
+        if queried_positions is not None:
+            queried_rows = [full_rows[position] for position in queried_positions]
+            queried_index = None
+            if full_index is not None:
+                queried_index = [
+                    full_index[position] if position < len(full_index) else None
+                    for position in queried_positions
+                ]
+        else:
+            if search_blobs is None and (query.search or "").strip():
+                # Built on the first search and reused by later ones.
+                search_blobs = list(map(_row_search_blob, full_rows))
+            queried_rows, queried_index, queried_positions = _query_materialized_rows(
+                columns=columns,
+                rows=full_rows,
+                index_values=full_index,
+                search=query.search,
+                sorts=query.sorts,
+                filters=query.filters,
+                search_blobs=search_blobs,
+            )
         safe_offset = max(0, min(query.offset, len(queried_rows)))
         safe_end = min(len(queried_rows), safe_offset + query.limit)
         return {
@@ -1595,8 +2133,8 @@ def _maybe_register_server_source(
 
     return register_source(
         columns=columns,
-        rows=full_rows,
-        index=full_index,
+        rows=None,
+        index=None,
         total_rows=total_rows,
         query_fn=generic_query_fn,
         schema_version=_schema_version(columns),
@@ -1629,50 +2167,269 @@ def _serialize_pandas(
     max_rows: int | None = None,
 ) -> tuple[list[dict], list[list], list | None, int, bool]:
     """Serialize a pandas DataFrame."""
-    total_rows = len(df)
-    truncated = False
-    view = df
-    if max_rows is not None and total_rows > max_rows:
-        view = df.iloc[:max_rows]
-        truncated = True
-
-    columns = []
-    for col in view.columns:
-        dtype = str(view[col].dtype)
-        col_type = _dtype_to_type(dtype)
-        columns.append(
-            {
-                "name": _display_column_name(col),
-                "type": col_type,
-                "_sourceKey": col,
-            }
-        )
+    view, total_rows, truncated = _pandas_view(df, max_rows)
+    dtypes = list(view.dtypes)
+    columns = _pandas_column_meta(view, dtypes)
+    if not total_rows:
+        return columns, [], None if hide_index else [], total_rows, truncated
 
-    # Serialize row-by-row without materializing the full dataframe first.
-    rows: list[list[Any]] = []
-    for row in view.itertuples(index=False, name=None):
-        rows.append([_to_json_safe(v) for v in row])
+    rows = _pandas_rows(view, dtypes)
 
     # Index
     index = None
     if not hide_index:
-        if hasattr(view.index, "tolist"):
-            index = [_to_json_safe(v) for v in view.index.tolist()]
-        else:
-            index = [_to_json_safe(v) for v in list(view.index)]
+        index = _index_to_json_safe(view.index)
 
     return columns, rows, index, total_rows, truncated
 
 
-def _serialize_dict(data: dict) -> tuple[list[dict], list[list], list | None]:
-    """Serialize a dict of lists (column-oriented)."""
-    columns = [{"name": str(k), "type": "auto"} for k in data.keys()]
+def _pandas_arrow_columns(view: Any) -> list[Any]:
+    """Per-column values for Arrow encoding of a pandas frame.
 
-    # Get max length
-    max_len = max((len(v) if isinstance(v, list) else 1) for v in data.values())
+    Numeric, boolean and string columns are handed to pyarrow as Series so
+    they convert from their buffers; other dtypes go through the JSON-safe
+    conversion so they render the same as the row-list path.
+    """
+    pd = _pandas()
+    values: list[Any] = []
+    for position, dtype in enumerate(view.dtypes):
+        series = view.iloc[:, position]
+        if getattr(dtype, "kind", "O") in ("b", "i", "u", "f") or isinstance(dtype, pd.StringDtype):
+            values.append(series)
+        else:
+            values.append(_column_to_json_safe(series))
+    return values
 
-    rows = []
-    for i in range(max_len):
+
+def _pandas_rows(view: Any, dtypes: list[Any]) -> list[list[Any]]:
+    block = _scalar_value_block(view, dtypes)
+    if block is not None:
+        return block.tolist()
+    # Convert column by column so each dtype is dispatched once, then
+    # stitch the converted columns back into rows.
+    column_values = _pandas_column_values(view, dtypes)
+    if column_values:
+        return list(map(list, zip(*column_values)))
+    return [[] for _ in range(len(view))]
+
+
+def _serialize_pandas_columnar(
+    df: Any,  # pandas.DataFrame
+    hide_index: bool,
+    *,
+    max_rows: int | None = None,
+) -> tuple[list[dict], list[list], list | None, int, bool]:
+    """Serialize a pandas DataFrame as one value list per column.
+
+    Same shape as ``_serialize_pandas`` except the second item holds
+    columns instead of rows, so no row transposition is needed.
+    """
+    view, total_rows, truncated = _pandas_view(df, max_rows)
+    dtypes = list(view.dtypes)
+    columns = _pandas_column_meta(view, dtypes)
+
+    block = _scalar_value_block(view, dtypes)
+    if block is not None:
+        column_values = block.T.tolist()
+    else:
+        column_values = _pandas_column_values(view, dtypes)
+
+    index = None
+    if not hide_index:
+        index = _index_to_json_safe(view.index)
+
+    return columns, column_values, index, total_rows, truncated
+
+
+def _pandas_view(df: Any, max_rows: int | None) -> tuple[Any, int, bool]:
+    total_rows = len(df)
+    if max_rows is not None and total_rows > max_rows:
+        return df.iloc[:max_rows], total_rows, True
+    return df, total_rows, False
+
+
+def _index_to_json_safe(index: Any) -> list[Any]:
+    """Convert a DataFrame index, reading a RangeIndex straight from its bounds.
+
+    The index is kept as its own bulk pass rather than stacked onto the
+    values: splitting it back out of each row would cost a Python-level
+    slice per row.
+    """
+    pd = _pandas()
+    if isinstance(index, pd.RangeIndex):
+        return list(range(index.start, index.stop, index.step))
+    if isinstance(index, pd.MultiIndex):
+        # Tuples become lists; MultiIndex has no usable isna() mask.
+        return list(map(_to_json_safe, index.tolist()))
+    return _column_to_json_safe(index)
+
+
+def _pandas_column_meta(view: Any, dtypes: list[Any]) -> list[dict[str, Any]]:
+    return [
+        {
+            "name": _display_column_name(col),
+            "type": _dtype_to_type(str(dtype)),
+            "_sourceKey": col,
+        }
+        for col, dtype in zip(view.columns, dtypes)
+    ]
+
+
+# Wide frames that miss the single-block path convert their columns on a
+# shared thread pool once they reach this many columns and cells; numpy
+# releases the GIL for much of each column's masking and conversion.
+_PARALLEL_MIN_COLUMNS = 16
+_PARALLEL_MIN_CELLS = 100_000
+
+
+@functools.lru_cache(maxsize=1)
+def _column_executor() -> ThreadPoolExecutor | None:
+    """Return the shared per-column worker pool, or None on a single core."""
+    workers = min(8, os.cpu_count() or 1)
+    if workers < 2:
+        return None
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fastlit-df")
+
+
+def _pandas_column_values(view: Any, dtypes: list[Any]) -> list[list[Any]]:
+    column_count = len(dtypes)
+    columns = (view.iloc[:, position] for position in range(column_count))
+    if column_count >= _PARALLEL_MIN_COLUMNS and column_count * len(view) >= _PARALLEL_MIN_CELLS:
+        executor = _column_executor()
+        if executor is not None:
+            return list(executor.map(_column_to_json_safe, columns))
+    return list(map(_column_to_json_safe, columns))
+
+
+def _scalar_value_block(view: Any, dtypes: list[Any]) -> Any | None:
+    """Return a frame's values as one 2-D array when every column is scalar.
+
+    Applies when all columns are numeric, boolean or string (numpy or
+    nullable extension dtypes), so ``tolist()`` on the result builds every
+    row (or, transposed, every column) in C. Frames sharing one numpy
+    numeric dtype keep that dtype; mixed frames go through an object array,
+    which boxes each column separately so ints are never upcast. Returns
+    None when any column needs per-value conversion (datetimes, objects,
+    categoricals, ...).
+    """
+    if not dtypes:
+        return None
+    np = _numpy()
+    pd = _pandas()
+
+    dtype = dtypes[0]
+    if isinstance(dtype, np.dtype) and dtype.kind in ("b", "i", "u", "f") and all(
+        isinstance(other, np.dtype) and other == dtype for other in dtypes[1:]
+    ):
+        block = view.to_numpy()
+        if dtype.kind == "f":
+            missing = np.isnan(block)
+            if missing.any():
+                block = block.astype(object)
+                block[missing] = None
+        return block
+
+    for other in dtypes:
+        if getattr(other, "kind", "O") not in ("b", "i", "u", "f") and not isinstance(
+            other, pd.StringDtype
+        ):
+            return None
+    return view.to_numpy(dtype=object, na_value=None)
+
+
+def _datetime64_to_iso(arr: Any) -> list[str | None]:
+    """Format a naive datetime64 array as ISO strings, NaT as ``None``.
+
+    Each value renders like its ``isoformat()``: whole seconds without a
+    fraction, then microseconds, and nanoseconds only where they are set.
+    Each precision is formatted in one ``np.datetime_as_string`` call.
+    """
+    np = _numpy()
+    result = np.full(arr.shape, None, dtype=object)
+    seconds = arr.astype("datetime64[s]")
+    whole = arr == seconds
+    if whole.any():
+        result[whole] = np.datetime_as_string(seconds[whole], unit="s")
+    fractional = ~(whole | np.isnat(arr))
+    if fractional.any():
+        micros = arr.astype("datetime64[us]")
+        exact = fractional & (arr == micros)
+        if exact.any():
+            result[exact] = np.datetime_as_string(micros[exact], unit="us")
+        nanos = fractional & ~exact
+        if nanos.any():
+            result[nanos] = np.datetime_as_string(
+                arr[nanos].astype("datetime64[ns]"), unit="ns"
+            )
+    return result.tolist()
+
+
+def _column_to_json_safe(values: Any) -> list[Any]:
+    """Convert a pandas Series/Index to JSON-safe values with one dtype dispatch.
+
+    Numeric, boolean, string, datetime and categorical columns are
+    converted in bulk; anything else (object, timedelta, ...) falls back to
+    the per-value ``_to_json_safe`` conversion.
+    """
+    np = _numpy()
+    pd = _pandas()
+
+    dtype = values.dtype
+    kind = getattr(dtype, "kind", "O")
+
+    if kind == "M" and isinstance(dtype, np.dtype):
+        return _datetime64_to_iso(values.to_numpy())
+    if kind == "M":
+        present = values.notna().tolist()
+        return [
+            value.isoformat() if ok else None
+            for value, ok in zip(values.tolist(), present)
+        ]
+
+    if isinstance(dtype, np.dtype):
+        if kind in ("b", "i", "u"):
+            # Can't hold missing values; tolist() yields native scalars.
+            return values.tolist()
+        if kind == "f":
+            if not values.hasnans:
+                return values.tolist()
+            return values.to_numpy(dtype=object, na_value=None).tolist()
+    elif kind in ("b", "i", "u", "f") or isinstance(dtype, pd.StringDtype):
+        # Nullable extension dtypes (Int64, boolean, Float64, string).
+        return values.to_numpy(dtype=object, na_value=None).tolist()
+    elif isinstance(dtype, pd.CategoricalDtype):
+        # Convert each category once and look cells up by code; the
+        # trailing None is what code -1 (missing) indexes.
+        categorical = values.array
+        lookup = _column_to_json_safe(categorical.categories)
+        lookup.append(None)
+        return list(map(lookup.__getitem__, categorical.codes.tolist()))
+
+    items = values.tolist()
+    if not values.hasnans:
+        return list(map(_to_json_safe, items))
+    # One vectorized NA mask per column instead of a pd.isna() per value.
+    missing = values.isna().tolist()
+    return [None if is_missing else _to_json_safe(value) for value, is_missing in zip(items, missing)]
+
+
+def _serialize_dict(data: dict) -> tuple[list[dict], list[list], list | None]:
+    """Serialize a dict of lists (column-oriented)."""
+    if not data:
+        return [], [], []
+    columns = [{"name": str(k), "type": "auto"} for k in data.keys()]
+
+    # Get max length
+    max_len = max((len(v) if isinstance(v, list) else 1) for v in data.values())
+
+    if all(isinstance(v, list) and len(v) == max_len for v in data.values()):
+        # Equal-length columns: convert column by column, then pivot to
+        # rows with a single zip.
+        cols = [list(map(_to_json_safe, v)) for v in data.values()]
+        return columns, list(map(list, zip(*cols))), list(range(max_len))
+
+    rows = []
+    for i in range(max_len):
         row = []
         for v in data.values():
             if isinstance(v, list):
@@ -1689,21 +2446,11 @@ def _serialize_dict(data: dict) -> tuple[list[dict], list[list], list | None]:
 
 def _serialize_list_of_dicts(data: list[dict]) -> tuple[list[dict], list[list], list | None]:
     """Serialize a list of dicts (row-oriented)."""
-    # Collect all keys
-    all_keys = []
-    seen = set()
-    for row in data:
-        for k in row.keys():
-            if k not in seen:
-                all_keys.append(k)
-                seen.add(k)
+    # Collect all keys, in first-seen order
+    all_keys = list(dict.fromkeys(k for row in data for k in row))
 
     columns = [{"name": str(k), "type": "auto"} for k in all_keys]
-
-    rows = []
-    for row_dict in data:
-        row = [_to_json_safe(row_dict.get(k)) for k in all_keys]
-        rows.append(row)
+    rows = _list_of_dicts_rows(data, all_keys)
 
     # Generate row indices
     index = list(range(len(data)))
@@ -1711,6 +2458,20 @@ def _serialize_list_of_dicts(data: list[dict]) -> tuple[list[dict], list[list],
     return columns, rows, index
 
 
+def _list_of_dicts_rows(data: list[dict], all_keys: list[Any]) -> list[list[Any]]:
+    """Serialize each dict's values for ``all_keys`` (None where absent)."""
+    if len(all_keys) > 1 and all(type(row_dict) is dict for row_dict in data):
+        # Dense data (every row has every key) is the common case; fetch
+        # each row's values with one C-level itemgetter call. Plain dicts
+        # only, so a __missing__ hook can't fill in absent keys.
+        get_values = itemgetter(*all_keys)
+        try:
+            return [list(map(_to_json_safe, get_values(row_dict))) for row_dict in data]
+        except KeyError:
+            pass
+    return [[_to_json_safe(row_dict.get(k)) for k in all_keys] for row_dict in data]
+
+
 def _serialize_list_of_lists(data: list) -> tuple[list[dict], list[list], list | None]:
     """Serialize a list of lists."""
     if not data:
@@ -1725,7 +2486,7 @@ def _serialize_list_of_lists(data: list) -> tuple[list[dict], list[list], list |
         data = [[item] for item in data]
 
     columns = [{"name": str(i), "type": "auto"} for i in range(num_cols)]
-    rows = [[_to_json_safe(v) for v in row] for row in data]
+    rows = [list(map(_to_json_safe, row)) for row in data]
 
     # Generate row indices
     index = list(range(len(data)))
@@ -1733,8 +2494,9 @@ def _serialize_list_of_lists(data: list) -> tuple[list[dict], list[list], list |
     return columns, rows, index
 
 
+@functools.lru_cache(maxsize=64)
 def _dtype_to_type(dtype: str) -> str:
-    """Map pandas dtype to simple type string."""
+    """Map pandas dtype to simple type string (cached; dtype names are few)."""
     dtype = dtype.lower()
     if "int" in dtype:
         return "integer"
@@ -1749,40 +2511,150 @@ def _dtype_to_type(dtype: str) -> str:
     return "string"
 
 
+def _json_identity(value: Any) -> Any:
+    return value
+
+
+def _json_float(value: Any) -> Any:
+    return None if value != value else value
+
+
+def _json_numpy_float(value: Any) -> Any:
+    return None if value != value else value.item()
+
+
+def _json_none(value: Any) -> Any:
+    return None
+
+
+def _json_numpy_item(value: Any) -> Any:
+    return value.item()
+
+
+def _json_isoformat(value: Any) -> Any:
+    return value.isoformat()
+
+
+def _json_dict(value: Any) -> Any:
+    return {str(k): _to_json_safe(v) for k, v in value.items()}
+
+
+def _json_sequence(value: Any) -> Any:
+    return list(map(_to_json_safe, value))
+
+
+# datetime64 units whose tolist() yields datetime.date/datetime objects
+# (within their year range), and so whose items serialize via isoformat().
+_DATE_UNITS = frozenset({"Y", "M", "W", "D"})
+_DATETIME_UNITS = frozenset({"h", "m", "s", "ms", "us"})
+
+
+def _json_ndarray(value: Any) -> Any:
+    if value.ndim == 0:
+        return _to_json_safe(value.item())
+    kind = value.dtype.kind
+    if kind in "iub":
+        # tolist() already yields native ints/bools.
+        return value.tolist()
+    np = _numpy()
+    if kind == "f":
+        if not np.isnan(value).any():
+            return value.tolist()
+    elif kind == "M" and _datetime64_array_is_pythonic(value):
+        if np.datetime_data(value.dtype)[0] in _DATE_UNITS:
+            text = np.datetime_as_string(value.astype("datetime64[D]"), unit="D")
+            text = text.astype(object)
+            text[np.isnat(value)] = None
+            return text.tolist()
+        return _datetime64_to_iso(value)
+    return [_to_json_safe(item) for item in value.tolist()]
+
+
+def _datetime64_array_is_pythonic(value: Any) -> bool:
+    """Whether ``value.tolist()`` would give dates/datetimes, not ints."""
+    np = _numpy()
+    unit = np.datetime_data(value.dtype)[0]
+    if unit not in _DATE_UNITS and unit not in _DATETIME_UNITS:
+        return False
+    present = value[~np.isnat(value)]
+    if present.size == 0:
+        return True
+    return bool(
+        present.min() >= np.datetime64("0001-01-01")
+        and present.max() < np.datetime64("9999-12-31")
+    )
+
+
+# Exact-type dispatch for _to_json_safe. Seeded with the native scalars;
+# numpy scalar and array, datetime and pandas NA/NaT types are registered
+# the first time the slow path classifies them, so pandas/numpy are never
+# imported just to probe.
+_JSON_SAFE_HANDLERS: dict[type, Callable[[Any], Any]] = {
+    str: _json_identity,
+    int: _json_identity,
+    bool: _json_identity,
+    type(None): _json_identity,
+    float: _json_float,
+    dict: _json_dict,
+    list: _json_sequence,
+    tuple: _json_sequence,
+    set: _json_sequence,
+}
+
+
 def _to_json_safe(value: Any) -> Any:
     """Convert value to JSON-serializable type."""
-    if value is None:
-        return None
+    handler = _JSON_SAFE_HANDLERS.get(type(value))
+    if handler is not None:
+        return handler(value)
+    return _to_json_safe_slow(value)
 
-    # Handle pandas NA/NaT
-    try:
-        import pandas as pd
 
-        if pd.isna(value):
+def _to_json_safe_slow(value: Any) -> Any:
+    # Containers first: pd.isna() on them builds a whole boolean array.
+    if isinstance(value, dict):
+        return _json_dict(value)
+
+    if isinstance(value, (list, tuple, set)):
+        return _json_sequence(value)
+
+    np = _numpy()
+    if np is not None and isinstance(value, np.ndarray):
+        if type(value) is np.ndarray:
+            _JSON_SAFE_HANDLERS[np.ndarray] = _json_ndarray
+        return _json_ndarray(value)
+
+    # Handle pandas NA/NaT
+    pd = _pandas()
+    if pd is not None:
+        if value is pd.NA or value is pd.NaT:
+            # Singleton missing markers with their own types; NaN floats
+            # and NaT datetime64 scalars are value-dependent and stay here.
+            _JSON_SAFE_HANDLERS[type(value)] = _json_none
             return None
-    except (ImportError, TypeError, ValueError):
-        pass
+        try:
+            if pd.isna(value):
+                return None
+        except (TypeError, ValueError):
+            pass
 
     # Handle numpy types
-    try:
-        import numpy as np
-
-        if isinstance(value, (np.integer, np.floating)):
+    if np is not None:
+        if isinstance(value, np.integer):
+            _JSON_SAFE_HANDLERS[type(value)] = _json_numpy_item
+            return value.item()
+        if isinstance(value, np.floating):
+            _JSON_SAFE_HANDLERS[type(value)] = _json_numpy_float
             return value.item()
-        if isinstance(value, np.ndarray):
-            return [_to_json_safe(item) for item in value.tolist()]
         if isinstance(value, np.bool_):
+            _JSON_SAFE_HANDLERS[type(value)] = bool
             return bool(value)
-    except ImportError:
-        pass
-
-    if isinstance(value, dict):
-        return {str(k): _to_json_safe(v) for k, v in value.items()}
-
-    if isinstance(value, (list, tuple, set)):
-        return [_to_json_safe(item) for item in value]
 
     # Handle datetime
+    if isinstance(value, (datetime.date, datetime.time)):
+        # Missing datetimes (NaT) have their own type, so this is stable.
+        _JSON_SAFE_HANDLERS[type(value)] = _json_isoformat
+        return value.isoformat()
     if hasattr(value, "isoformat"):
         return value.isoformat()
 
@@ -1795,14 +2667,16 @@ def _to_json_safe(value: Any) -> Any:
 
 
 def _schema_version(columns: list[dict[str, Any]]) -> str:
+    return _encode_schema_version(
+        tuple((str(col.get("name", "")), str(col.get("type", ""))) for col in columns)
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _encode_schema_version(signature: tuple[tuple[str, str], ...]) -> str:
+    """JSON schema version for ``(name, type)`` pairs, cached per signature."""
     return json.dumps(
-        [
-            {
-                "name": str(col.get("name", "")),
-                "type": str(col.get("type", "")),
-            }
-            for col in columns
-        ],
+        [{"name": name, "type": type_name} for name, type_name in signature],
         sort_keys=True,
         separators=(",", ":"),
     )
@@ -1816,9 +2690,8 @@ def _query_pandas_dataframe(
     sorts: tuple[Any, ...],
     filters: tuple[Any, ...],
 ) -> Any:
-    try:
-        import pandas as pd
-    except ImportError:
+    pd = _pandas()
+    if pd is None:
         return df
 
     view = df
@@ -1830,27 +2703,34 @@ def _query_pandas_dataframe(
     column_names = list(column_map.keys())
     search_value = (search or "").strip()
     if search_value:
-        mask = pd.Series(False, index=view.index)
         lowered_search = search_value.lower()
-        for col in column_names:
-            raw_key = column_map.get(col, col)
-            if raw_key not in view.columns:
-                continue
-            series = view[raw_key]
-            mask = mask | series.map(
-                lambda value: lowered_search in _searchable_text(value)
-            )
-        view = view[mask]
+        searched = [
+            view[column_map.get(col, col)]
+            for col in column_names
+            if column_map.get(col, col) in view.columns
+        ]
+        view = view[_any_search_mask(searched, lowered_search, len(view))]
 
+    # Numeric comparisons on numpy columns are collected and evaluated as
+    # one fused expression; the remaining filters apply one mask each.
+    numeric_terms: list[tuple[Any, str, float]] = []
+    other_filters: list[tuple[Any, str, Any]] = []
     for flt in filters:
         column_name = getattr(flt, "column", None)
         raw_key = column_map.get(str(column_name), column_name)
         op = getattr(flt, "op", "")
         if not column_name or raw_key not in view.columns:
             continue
-        series = view[raw_key]
-        mask = series.map(lambda value: _matches_filter(value, op, getattr(flt, "value", None)))
-        view = view[mask]
+        filter_value = getattr(flt, "value", None)
+        terms = _numeric_filter_terms(view[raw_key], op, filter_value)
+        if terms is None:
+            other_filters.append((raw_key, op, filter_value))
+        else:
+            numeric_terms.extend(terms)
+    if numeric_terms:
+        view = view[_numeric_terms_mask(numeric_terms, len(view))]
+    for raw_key, op, filter_value in other_filters:
+        view = view[_filter_mask(view[raw_key], op, filter_value)]
 
     if sorts:
         by: list[str] = []
@@ -1867,17 +2747,328 @@ def _query_pandas_dataframe(
             try:
                 view = view.sort_values(by=by, ascending=ascending, kind="stable")
             except TypeError:
-                sort_keys = [
-                    view[column].map(lambda value: _sort_key(value))
-                    for column in by
-                ]
-                temp_df = view.assign(**{f"__fastlit_sort_{idx}": sort_keys[idx] for idx in range(len(by))})
-                temp_names = [f"__fastlit_sort_{idx}" for idx in range(len(by))]
-                temp_df = temp_df.sort_values(by=temp_names, ascending=ascending, kind="stable")
+                temp_columns: dict[str, Any] = {}
+                temp_ascending: list[bool] = []
+                for idx, (column, column_ascending) in enumerate(zip(by, ascending)):
+                    rank, key = _sort_key_columns(view[column])
+                    temp_columns[f"__fastlit_sort_{idx}_rank"] = rank
+                    temp_columns[f"__fastlit_sort_{idx}"] = key
+                    temp_ascending += [column_ascending, column_ascending]
+                temp_names = list(temp_columns)
+                temp_df = view.assign(**temp_columns)
+                temp_df = temp_df.sort_values(by=temp_names, ascending=temp_ascending, kind="stable")
                 view = temp_df.drop(columns=temp_names)
     return view
 
 
+def _any_search_mask(searched: list[Any], lowered_search: str, length: int) -> Any:
+    """Boolean array of the rows where any of ``searched`` contains the search.
+
+    Large searches compute each column's mask on the shared worker pool.
+    """
+    np = _numpy()
+    mask = np.zeros(length, dtype=bool)
+    searched = [series for series in searched if _search_can_match(series.dtype, lowered_search)]
+    column_masks = None
+    if len(searched) > 1 and len(searched) * length >= _PARALLEL_MIN_CELLS:
+        executor = _column_executor()
+        if executor is not None:
+            column_masks = executor.map(_search_mask, searched, repeat(lowered_search))
+    if column_masks is None:
+        column_masks = (_search_mask(series, lowered_search) for series in searched)
+    for column_mask in column_masks:
+        np.logical_or(mask, column_mask, out=mask)
+    return mask
+
+
+def _sort_key_columns(series: Any) -> tuple[Any, Any]:
+    """Vectorized ``_sort_key`` for one column, as a (rank, key) pair of arrays.
+
+    Missing cells get rank 1 so they sort after present values, as None
+    does in ``_sort_key``; string columns sort case-insensitively and
+    numeric/boolean object columns numerically. Other columns fall back to
+    per-cell ``_sort_key`` tuples under a constant rank.
+    """
+    pd = _pandas()
+    np = _numpy()
+    missing = series.isna().to_numpy()
+    inferred = pd.api.types.infer_dtype(series, skipna=True)
+    if inferred in ("string", "empty"):
+        key = series.mask(missing, "").str.lower()
+    elif inferred in ("integer", "floating", "mixed-integer-float", "decimal"):
+        key = pd.to_numeric(series.mask(missing, 0))
+    elif inferred == "boolean":
+        key = series.mask(missing, False).astype(bool)
+    else:
+        return np.zeros(len(series), dtype=np.int8), series.map(_sort_key)
+    return missing.astype(np.int8), key
+
+
+def _cell_check(column_idx: int, predicate: Callable[[Any], bool]) -> Callable[[int, list[Any]], bool]:
+    """Row check applying ``predicate`` to one cell (None past a short row)."""
+
+    def check(position: int, row: list[Any]) -> bool:
+        return predicate(row[column_idx] if column_idx < len(row) else None)
+
+    return check
+
+
+def _searchable_text_series(series: Any) -> Any | None:
+    """``_searchable_text`` of every cell, built with vectorized string methods.
+
+    Covers string, numeric and boolean columns; returns None for anything
+    else. Missing cells keep their per-value text (``None`` -> "", NaN ->
+    "nan").
+    """
+    pd = _pandas()
+    dtype = series.dtype
+    if getattr(dtype, "kind", None) in ("b", "i", "u", "f"):
+        # pandas 3's astype(str) keeps missing values missing; they are
+        # filled below like those of string columns.
+        text = series.astype(str).str.lower().astype(object)
+    elif isinstance(dtype, pd.StringDtype) or (
+        dtype == object and pd.api.types.infer_dtype(series, skipna=True) in ("string", "empty")
+    ):
+        text = series.str.lower().astype(object)
+    else:
+        return None
+    missing = series.isna().to_numpy()
+    if missing.any():
+        text[missing] = [_searchable_text(value) for value in series[missing]]
+    return text
+
+
+# Every character numpy columns of each kind can render as search text
+# (``astype(str).lower()``): floats include "nan", "inf" and exponents.
+_SEARCH_TEXT_ALPHABETS = {
+    "i": frozenset("0123456789-"),
+    "u": frozenset("0123456789"),
+    "f": frozenset("0123456789.-+einaf"),
+}
+
+
+def _search_can_match(dtype: Any, lowered_search: str) -> bool:
+    """False when no cell of a ``dtype`` column can contain the search."""
+    np = _numpy()
+    if np is None or not isinstance(dtype, np.dtype):
+        # Nullable extension dtypes render missing cells as "<NA>".
+        return True
+    kind = dtype.kind
+    if kind == "b":
+        return lowered_search in "true" or lowered_search in "false"
+    alphabet = _SEARCH_TEXT_ALPHABETS.get(kind)
+    return alphabet is None or alphabet.issuperset(lowered_search)
+
+
+def _search_mask(series: Any, lowered_search: str) -> Any:
+    """Boolean array of the cells whose ``_searchable_text`` contains the search."""
+    text = _searchable_text_series(series)
+    if text is None:
+        return series.map(lambda value: lowered_search in _searchable_text(value)).to_numpy(dtype=bool)
+    return text.str.contains(lowered_search, regex=False).to_numpy(dtype=bool)
+
+
+_NUMERIC_FILTER_OPS = {"gt": gt, "gte": ge, "lt": lt, "lte": le}
+_DATE_FILTER_OPS = {"before": lt, "on_or_before": le, "after": gt, "on_or_after": ge}
+_TEXT_FILTER_OPS = {"contains", "not_contains", "equals", "not_equals"}
+
+
+@functools.lru_cache(maxsize=1)
+def _numexpr() -> Any:
+    """Return the numexpr module, or None if it isn't installed (cached)."""
+    try:
+        import numexpr
+    except ImportError:
+        return None
+    return numexpr
+
+
+_NUMERIC_FILTER_SYMBOLS = {"gt": ">", "gte": ">=", "lt": "<", "lte": "<="}
+
+
+def _numeric_filter_terms(series: Any, op: str, filter_value: Any) -> list[tuple[Any, str, float]] | None:
+    """Split a numeric filter on a numpy numeric column into comparison terms.
+
+    Each term is ``(values, op, bound)``, all of which must hold; an
+    empty list matches every row. Returns None for any other filter.
+    """
+    np = _numpy()
+    dtype = series.dtype
+    if not (isinstance(dtype, np.dtype) and dtype.kind in ("b", "i", "u", "f")):
+        return None
+    if op in _NUMERIC_FILTER_SYMBOLS:
+        rhs = _coerce_number(filter_value)
+        if rhs is None:
+            return []
+        return [(series.to_numpy(dtype=float), op, rhs)]
+    if op == "between" and isinstance(filter_value, (list, tuple)) and len(filter_value) == 2:
+        low = _coerce_number(filter_value[0])
+        high = _coerce_number(filter_value[1])
+        if low is not None and high is not None:
+            values = series.to_numpy(dtype=float)
+            return [(values, "gte", low), (values, "lte", high)]
+    return None
+
+
+def _numeric_terms_mask(terms: list[tuple[Any, str, float]], length: int) -> Any:
+    """AND together comparison terms, in one numexpr pass when available."""
+    np = _numpy()
+    numexpr = _numexpr()
+    if numexpr is not None:
+        local_dict: dict[str, Any] = {}
+        clauses = []
+        for position, (values, op, bound) in enumerate(terms):
+            local_dict[f"c{position}"] = values
+            local_dict[f"v{position}"] = bound
+            clauses.append(f"(c{position} {_NUMERIC_FILTER_SYMBOLS[op]} v{position})")
+        return numexpr.evaluate(" & ".join(clauses), local_dict=local_dict)
+    mask = np.ones(length, dtype=bool)
+    for values, op, bound in terms:
+        mask &= _NUMERIC_FILTER_OPS[op](values, bound)
+    return mask
+
+
+def _filter_mask(series: Any, op: str, filter_value: Any) -> Any:
+    """Boolean array of the cells for which ``_matches_filter`` holds.
+
+    Text ops on string/numeric/boolean columns and emptiness/truth ops on
+    numpy numeric columns run vectorized; other combinations map a compiled
+    predicate over the cells. Numeric comparisons on numpy columns are
+    handled by ``_numeric_filter_terms`` before this is reached.
+    """
+    np = _numpy()
+    dtype = series.dtype
+    if op in _TEXT_FILTER_OPS:
+        text = _searchable_text_series(series)
+        if text is not None:
+            needle = _searchable_text(filter_value)
+            if op in ("contains", "not_contains"):
+                mask = text.str.contains(needle, regex=False).to_numpy(dtype=bool)
+            else:
+                mask = (text == needle).to_numpy(dtype=bool)
+            return ~mask if op.startswith("not_") else mask
+    elif isinstance(dtype, np.dtype) and dtype.kind in ("b", "i", "u", "f"):
+        if op in ("is_empty", "not_empty"):
+            # Numbers (NaN included) are never empty.
+            return np.full(len(series), op == "not_empty")
+        if op in ("is_true", "is_false"):
+            if dtype.kind != "b":
+                return np.zeros(len(series), dtype=bool)
+            values = series.to_numpy()
+            return values if op == "is_true" else ~values
+    return series.map(_compile_filter(op, filter_value)).to_numpy(dtype=bool)
+
+
+# Row count from which generic sources are queried through a DataFrame;
+# below it, building one costs more than the list-based query saves.
+_GENERIC_QUERY_FRAME_MIN_ROWS = 10_000
+
+
+def _generic_query_frame(rows: list[list[Any]]) -> Any | None:
+    """DataFrame over a generic source's rows for ``_query_generic_frame``.
+
+    Column labels are cell positions, so duplicate display names are kept
+    apart; short rows are padded with None. Columns of plain ints (that fit
+    int64) or NaN-free floats get a numeric dtype so filters on them run
+    vectorized; all others stay object, keeping each cell as stored. None
+    without pandas, or for tables too small to benefit.
+    """
+    pd = _pandas()
+    if pd is None or len(rows) < _GENERIC_QUERY_FRAME_MIN_ROWS:
+        return None
+    np = _numpy()
+    width = max(map(len, rows), default=0)
+    data: dict[int, Any] = {}
+    for column_idx in range(width):
+        series = pd.Series(
+            [row[column_idx] if column_idx < len(row) else None for row in rows],
+            dtype=object,
+        )
+        inferred = pd.api.types.infer_dtype(series, skipna=False)
+        if inferred == "integer":
+            try:
+                series = series.astype("int64")
+            except OverflowError:
+                pass
+        elif inferred == "floating":
+            typed = series.astype("float64")
+            if not np.isnan(typed.to_numpy()).any():
+                series = typed
+        data[column_idx] = series
+    return pd.DataFrame(data, index=pd.RangeIndex(len(rows)))
+
+
+def _query_generic_frame(
+    frame: Any,
+    *,
+    columns: list[dict[str, Any]],
+    search: str,
+    sorts: tuple[Any, ...],
+    filters: tuple[Any, ...],
+) -> list[int] | None:
+    """Matching row positions of a ``_generic_query_frame``, in query order.
+
+    Gives the same positions as ``_query_materialized_rows``: filters read
+    the last column of a name and sorts the first, filters on unknown
+    columns test None, searches cover every cell, and sorts use
+    ``_sort_key`` order (case-insensitive, None last ascending and first
+    descending, ties in row order). None if the sort keys don't compare,
+    for the list-based path to handle.
+    """
+    column_names = [str(col.get("name", "")) for col in columns]
+    filter_lookup = {name: idx for idx, name in enumerate(column_names)}
+    sort_lookup = {name: idx for idx, name in reversed(list(enumerate(column_names)))}
+
+    view = frame
+    for flt in filters:
+        column = getattr(flt, "column", "")
+        if not column:
+            continue
+        op = getattr(flt, "op", "")
+        filter_value = getattr(flt, "value", None)
+        column_idx = filter_lookup.get(column)
+        if column_idx is None or column_idx not in view.columns:
+            # Unknown columns read as None in every row.
+            if not _compile_filter(op, filter_value)(None):
+                return []
+            continue
+        series = view[column_idx]
+        terms = _numeric_filter_terms(series, op, filter_value)
+        if terms is None:
+            view = view[_filter_mask(series, op, filter_value)]
+        elif terms:
+            view = view[_numeric_terms_mask(terms, len(view))]
+
+    search_value = (search or "").strip().lower()
+    if search_value:
+        searched = [view[column_idx] for column_idx in view.columns]
+        view = view[_any_search_mask(searched, search_value, len(view))]
+
+    sort_columns = [
+        (sort_lookup[getattr(sort, "column", "")], getattr(sort, "direction", "asc") != "desc")
+        for sort in sorts
+        if getattr(sort, "column", "") in sort_lookup
+    ]
+    sort_columns = [(idx, ascending) for idx, ascending in sort_columns if idx in view.columns]
+    if not sort_columns:
+        return view.index.tolist()
+    pd = _pandas()
+    keys: dict[str, Any] = {}
+    ascending: list[bool] = []
+    for position, (column_idx, column_ascending) in enumerate(sort_columns):
+        rank, key = _sort_key_columns(view[column_idx])
+        keys[f"rank{position}"] = rank
+        keys[f"key{position}"] = key
+        ascending += [column_ascending, column_ascending]
+    try:
+        ordered = pd.DataFrame(keys, index=view.index).sort_values(
+            by=list(keys), ascending=ascending, kind="stable"
+        )
+    except TypeError:
+        return None
+    return ordered.index.tolist()
+
+
 def _query_materialized_rows(
     *,
     columns: list[dict[str, Any]],
@@ -1886,55 +3077,124 @@ def _query_materialized_rows(
     search: str,
     sorts: tuple[Any, ...],
     filters: tuple[Any, ...],
+    search_blobs: list[str] | None = None,
 ) -> tuple[list[list[Any]], list[Any] | None, list[int]]:
+    """Search, filter and sort row lists.
+
+    ``search_blobs``, if given, holds ``_row_search_blob`` of each row and
+    lets search test one string per row.
+    """
     column_names = [str(col.get("name", "")) for col in columns]
-    items: list[tuple[int, list[Any], Any]] = []
-    for row_idx, row in enumerate(rows):
-        idx_value = index_values[row_idx] if index_values is not None and row_idx < len(index_values) else None
-        items.append((row_idx, row, idx_value))
+    positions = list(range(len(rows)))
+    # Name -> position lookups, built once. With duplicate names, filters
+    # read the last such column and sorts the first.
+    filter_lookup = {name: idx for idx, name in enumerate(column_names)}
+    sort_lookup = {name: idx for idx, name in reversed(list(enumerate(column_names)))}
+
+    # Sorts read whole columns; each sorted column is pulled out of the
+    # rows once and then indexed by row position.
+    column_cache: dict[int, list[Any]] = {}
+
+    def column_values(column_idx: int) -> list[Any]:
+        values = column_cache.get(column_idx)
+        if values is None:
+            values = [row[column_idx] if column_idx < len(row) else None for row in rows]
+            column_cache[column_idx] = values
+        return values
+
+    # Filters and search are fused into one pass over the rows: each check
+    # is built once, filters first since search is usually the costlier.
+    checks: list[Callable[[int, list[Any]], bool]] = []
+    matches_nothing = False
+    if filters:
+        for flt in filters:
+            column = getattr(flt, "column", "")
+            if not column:
+                continue
+            predicate = _compile_filter(getattr(flt, "op", ""), getattr(flt, "value", None))
+            column_idx = filter_lookup.get(column)
+            if column_idx is None:
+                # Unknown columns read as None in every row.
+                matches_nothing = matches_nothing or not predicate(None)
+                continue
+            checks.append(_cell_check(column_idx, predicate))
 
     search_value = (search or "").strip().lower()
-    if search_value:
-        items = [
-            item
-            for item in items
-            if any(search_value in _searchable_text(value) for value in item[1])
+    if search_value and search_blobs is not None and _SEARCH_BLOB_SEPARATOR not in search_value:
+        checks.append(lambda position, row: search_value in search_blobs[position])
+    elif search_value:
+        checks.append(lambda position, row: any(search_value in _searchable_text(value) for value in row))
+
+    if matches_nothing:
+        positions = []
+    elif len(checks) == 1:
+        check = checks[0]
+        positions = [position for position, row in enumerate(rows) if check(position, row)]
+    elif checks:
+        positions = [
+            position
+            for position, row in enumerate(rows)
+            if all(check(position, row) for check in checks)
         ]
 
-    if filters:
-        next_items: list[tuple[int, list[Any], Any]] = []
-        for item in items:
-            row_map = {
-                column_names[idx]: item[1][idx] if idx < len(item[1]) else None
-                for idx in range(len(column_names))
-            }
-            if all(
-                _matches_filter(row_map.get(getattr(flt, "column", "")), getattr(flt, "op", ""), getattr(flt, "value", None))
-                for flt in filters
-                if getattr(flt, "column", "")
-            ):
-                next_items.append(item)
-        items = next_items
-
     if sorts:
-        for sort in reversed(sorts):
-            column_name = getattr(sort, "column", "")
-            if column_name not in column_names:
-                continue
-            column_idx = column_names.index(column_name)
-            reverse = getattr(sort, "direction", "asc") == "desc"
-            items.sort(
-                key=lambda item: _sort_key(item[1][column_idx] if column_idx < len(item[1]) else None),
+        sort_columns = [
+            (sort_lookup[getattr(sort, "column", "")], getattr(sort, "direction", "asc") == "desc")
+            for sort in sorts
+            if getattr(sort, "column", "") in sort_lookup
+        ]
+        # One stable pass per run of same-direction sorts, last run first,
+        # keyed on a tuple over the run's columns. Equivalent to one pass
+        # per column, with fewer passes and key calls.
+        runs = [
+            (reverse, [column_values(column_idx) for column_idx, _ in run])
+            for reverse, run in groupby(sort_columns, key=itemgetter(1))
+        ]
+        for reverse, run_values in reversed(runs):
+            positions.sort(
+                key=lambda position: tuple(_sort_key(values[position]) for values in run_values),
                 reverse=reverse,
             )
 
-    queried_rows = [item[1] for item in items]
-    queried_index = [item[2] for item in items] if index_values is not None else None
-    queried_positions = [int(item[0]) for item in items]
-    return queried_rows, queried_index, queried_positions
+    queried_rows = [rows[position] for position in positions]
+    queried_index = None
+    if index_values is not None:
+        queried_index = [
+            index_values[position] if position < len(index_values) else None
+            for position in positions
+        ]
+    return queried_rows, queried_index, positions
+
+
+# Short strings get their search text and sort key memoized. Search, filter
+# and sort revisit the same few labels of low-cardinality columns on every
+# query. Longer strings and other scalars are cheap enough, or too varied,
+# to be worth keeping cell values in a process-wide cache; floats would
+# also share entries between 0.0 and -0.0.
+_MEMOIZED_TEXT_MAX_LENGTH = 32
+
+
+def _is_memoized_text(value: Any) -> bool:
+    return type(value) is str and len(value) <= _MEMOIZED_TEXT_MAX_LENGTH
+
+
+@functools.lru_cache(maxsize=4096)
+def _short_text_lower(value: str) -> str:
+    return value.lower()
+
+
+# Joins a row's cell texts in its search blob. Searches containing it can't
+# use the blob, since a match could then span two cells.
+_SEARCH_BLOB_SEPARATOR = "\x00"
+
+
+def _row_search_blob(row: list[Any]) -> str:
+    return _SEARCH_BLOB_SEPARATOR.join(map(_searchable_text, row))
 
 
 def _searchable_text(value: Any) -> str:
+    if _is_memoized_text(value):
+        return _short_text_lower(value)
     if value is None:
         return ""
     if isinstance(value, str):
@@ -1942,13 +3202,38 @@ def _searchable_text(value: Any) -> str:
     if isinstance(value, (int, float, bool)):
         return str(value).lower()
     if isinstance(value, dict):
-        return json.dumps(value, ensure_ascii=False, sort_keys=True).lower()
+        return _dumps_text(value, sort_keys=True).lower()
     if isinstance(value, (list, tuple, set)):
-        return " ".join(_searchable_text(item) for item in value)
+        return _sequence_searchable_text(value)
     return str(value).lower()
 
 
+def _sequence_searchable_text(value: list | tuple | set) -> str:
+    """Space-joined search text of a sequence, flattening nested sequences.
+
+    Walks nested lists with an explicit stack of iterators instead of a
+    recursive call per level. Gives the same text as joining recursively;
+    an empty nested sequence still contributes an empty part.
+    """
+    parts: list[str] = []
+    stack = [iter(value)]
+    while stack:
+        for item in stack[-1]:
+            if isinstance(item, (list, tuple, set)):
+                if item:
+                    stack.append(iter(item))
+                    break
+                parts.append("")
+            else:
+                parts.append(_searchable_text(item))
+        else:
+            stack.pop()
+    return " ".join(parts)
+
+
 def _sort_key(value: Any) -> tuple[int, Any]:
+    if _is_memoized_text(value):
+        return (0, _short_text_lower(value))
     if value is None:
         return (1, "")
     if isinstance(value, bool):
@@ -1958,12 +3243,29 @@ def _sort_key(value: Any) -> tuple[int, Any]:
     if isinstance(value, str):
         return (0, value.lower())
     if isinstance(value, (list, tuple, set)):
-        return (0, json.dumps([_to_json_safe(item) for item in value], ensure_ascii=False))
+        return (0, _dumps_text([_to_json_safe(item) for item in value]))
     if isinstance(value, dict):
-        return (0, json.dumps(_to_json_safe(value), ensure_ascii=False, sort_keys=True))
+        return (0, _dumps_text(_to_json_safe(value), sort_keys=True))
     return (0, str(value).lower())
 
 
+def _dumps_text(value: Any, *, sort_keys: bool = False) -> str:
+    """Compact JSON text of a container, for search text and sort keys."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        try:
+            return orjson.dumps(value, default=str, option=option).decode("utf-8")
+        except TypeError:
+            pass
+    return json.dumps(
+        value,
+        ensure_ascii=False,
+        sort_keys=sort_keys,
+        separators=(",", ":"),
+        default=str,
+    )
+
+
 def _matches_filter(value: Any, op: str, filter_value: Any) -> bool:
     if op == "":
         return True
@@ -2042,6 +3344,92 @@ def _matches_filter(value: Any, op: str, filter_value: Any) -> bool:
     return True
 
 
+def _compile_filter(op: str, filter_value: Any) -> Callable[[Any], bool]:
+    """Return a predicate equivalent to ``_matches_filter(value, op, filter_value)``.
+
+    The op is dispatched and the filter value coerced once here, instead of
+    once per cell.
+    """
+    if op in _NUMERIC_FILTER_OPS:
+        rhs = _coerce_number(filter_value)
+        if rhs is None:
+            return lambda value: _coerce_number(value) is not None
+        compare = _NUMERIC_FILTER_OPS[op]
+
+        def numeric_predicate(value: Any) -> bool:
+            numeric = _coerce_number(value)
+            return numeric is not None and compare(numeric, rhs)
+
+        return numeric_predicate
+
+    if op in _TEXT_FILTER_OPS:
+        needle = _searchable_text(filter_value)
+        if op == "contains":
+            return lambda value: needle in _searchable_text(value)
+        if op == "not_contains":
+            return lambda value: needle not in _searchable_text(value)
+        if op == "equals":
+            return lambda value: _searchable_text(value) == needle
+        return lambda value: _searchable_text(value) != needle
+
+    if op in ("contains_any", "contains_all"):
+        filter_items = _normalize_list_like(filter_value)
+        combine = any if op == "contains_any" else all
+
+        def list_predicate(value: Any) -> bool:
+            items = _normalize_list_like(value)
+            return combine(item in items for item in filter_items)
+
+        return list_predicate
+
+    if op in _DATE_FILTER_OPS:
+        rhs_date = _coerce_datetime(filter_value)
+        if rhs_date is None:
+            return lambda value: False
+        compare = _DATE_FILTER_OPS[op]
+
+        def date_predicate(value: Any) -> bool:
+            lhs = _coerce_datetime(value)
+            return lhs is not None and compare(lhs, rhs_date)
+
+        return date_predicate
+
+    if op == "between":
+        if not (isinstance(filter_value, (list, tuple)) and len(filter_value) == 2):
+            return lambda value: True
+        low_number = _coerce_number(filter_value[0])
+        high_number = _coerce_number(filter_value[1])
+        numeric_bounds = low_number is not None and high_number is not None
+        low_date = _coerce_datetime(filter_value[0])
+        high_date = _coerce_datetime(filter_value[1])
+        date_bounds = low_date is not None and high_date is not None
+
+        def between_predicate(value: Any) -> bool:
+            if numeric_bounds:
+                numeric = _coerce_number(value)
+                if numeric is not None:
+                    return low_number <= numeric <= high_number
+            if date_bounds:
+                lhs = _coerce_datetime(value)
+                if lhs is not None:
+                    return low_date <= lhs <= high_date
+            return True
+
+        return between_predicate
+
+    if op == "is_empty":
+        return _is_empty_value
+    if op == "not_empty":
+        return lambda value: not _is_empty_value(value)
+    if op == "is_true":
+        return lambda value: value is True
+    if op == "is_false":
+        return lambda value: value is False
+
+    # "" and unknown ops match everything.
+    return lambda value: True
+
+
 def _normalize_list_like(value: Any) -> list[Any]:
     if value is None:
         return []
@@ -2075,18 +3463,67 @@ def _coerce_number(value: Any) -> float | None:
     return None
 
 
-def _coerce_datetime(value: Any) -> str | None:
-    if value is None:
+def _coerce_datetime(value: Any) -> int | None:
+    """Nanosecond ordinal for a date-like value, or None.
+
+    Date filters compare these integers instead of ISO strings, which only
+    order correctly when both sides share one canonical format. Naive
+    datetimes count as UTC; times of day are nanoseconds since midnight.
+    """
+    if value is None or isinstance(value, (bool, int, float)):
         return None
-    if hasattr(value, "isoformat"):
-        try:
-            return str(value.isoformat())
-        except Exception:
-            return None
     if isinstance(value, str):
-        raw = value.strip()
-        return raw or None
-    return str(value)
+        return _parse_datetime_text(value.strip())
+    try:
+        if isinstance(value, datetime.datetime):
+            return _datetime_ordinal(value)
+        if isinstance(value, datetime.date):
+            return _datetime_ordinal(datetime.datetime.combine(value, datetime.time()))
+        if isinstance(value, datetime.time):
+            return _time_ordinal(value)
+    except (AttributeError, TypeError, ValueError, OverflowError):
+        # pd.NaT is a datetime subclass that supports no arithmetic.
+        return None
+    return _parse_datetime_text(str(value))
+
+
+_NAIVE_EPOCH = datetime.datetime(1970, 1, 1)
+_UTC_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def _datetime_ordinal(value: datetime.datetime) -> int:
+    delta = value - (_NAIVE_EPOCH if value.tzinfo is None else _UTC_EPOCH)
+    micros = (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+    # pandas Timestamps carry sub-microsecond precision.
+    return micros * 1_000 + getattr(value, "nanosecond", 0)
+
+
+def _time_ordinal(value: datetime.time) -> int:
+    seconds = value.hour * 3_600 + value.minute * 60 + value.second
+    return (seconds * 1_000_000 + value.microsecond) * 1_000
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_datetime_text(raw: str) -> int | None:
+    """Parse ``raw`` once per distinct string; filter columns repeat values."""
+    if not raw:
+        return None
+    try:
+        return _datetime_ordinal(datetime.datetime.fromisoformat(raw))
+    except ValueError:
+        pass
+    try:
+        return _time_ordinal(datetime.time.fromisoformat(raw))
+    except ValueError:
+        pass
+    pd = _pandas()
+    if pd is None:
+        return None
+    try:
+        stamp = pd.Timestamp(raw)
+    except (TypeError, ValueError, OverflowError):
+        return None
+    return None if stamp is pd.NaT else int(stamp.value)
 
 
 def _is_empty_value(value: Any) -> bool:
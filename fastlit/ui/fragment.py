@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import datetime
 import functools
+import sys
 from typing import Any, Callable
 
 from fastlit.runtime.context import get_current_session
@@ -11,6 +12,10 @@ from fastlit.ui.base import _make_id
 from fastlit.runtime.tree import UINode
 
 
+# Unit suffixes in match order: "ms" must be tried before "s".
+_RUN_EVERY_UNITS = (("ms", 0.001), ("s", 1.0), ("m", 60.0), ("h", 3600.0))
+
+
 def _parse_run_every(run_every: Any) -> float | None:
     """Convert *run_every* to a float number of seconds, or None if unset.
 
@@ -29,14 +34,9 @@ def _parse_run_every(run_every: Any) -> float | None:
         return float(run_every)
     if isinstance(run_every, str):
         s = run_every.strip()
-        if s.endswith("ms"):
-            return float(s[:-2]) / 1000.0
-        if s.endswith("s"):
-            return float(s[:-1])
-        if s.endswith("m"):
-            return float(s[:-1]) * 60.0
-        if s.endswith("h"):
-            return float(s[:-1]) * 3600.0
+        for suffix, seconds in _RUN_EVERY_UNITS:
+            if s.endswith(suffix):
+                return float(s[: -len(suffix)]) * seconds
         return float(s)  # bare number → assume seconds
     raise ValueError(f"Invalid run_every value: {run_every!r}")
 
@@ -72,40 +72,37 @@ def fragment(func: Callable | None = None, *, run_every: Any = None) -> Callable
     interval_s: float | None = _parse_run_every(run_every)
 
     def decorator(f: Callable) -> Callable:
-        @functools.wraps(f)
-        def wrapper(*args: Any, **kwargs: Any) -> Any:
-            session = get_current_session()
-
-            # Compute a stable ID for the fragment container using the
-            # *caller's* file+line (walk frame to user code, same as _make_id).
-            fragment_id = _make_id("fragment")
-
-            # Register the function so run_fragment() can call it later.
-            session._fragment_registry[fragment_id] = (f, args, kwargs)
-
-            # Store the auto-refresh interval for this fragment.
-            # This dict persists across full reruns so the WS handler can
-            # maintain asyncio timer tasks across the session lifetime.
-            if interval_s is not None:
+        # The interval is known here, so pick a wrapper specialized on it
+        # rather than testing it on every call.
+        if interval_s is None:
+
+            @functools.wraps(f)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                session = get_current_session()
+
+                # Compute a stable ID for the fragment container using the
+                # *caller's* file+line (walk frame to user code, same as _make_id).
+                # Interned so every rerun keys the session's fragment dicts
+                # with the very object already stored there.
+                fragment_id = sys.intern(_make_id("fragment"))
+
+                # Register the function so run_fragment() can call it later.
+                session._fragment_registry[fragment_id] = (f, args, kwargs)
+                return _render_fragment(session, fragment_id, f, args, kwargs)
+
+        else:
+
+            @functools.wraps(f)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                session = get_current_session()
+                fragment_id = sys.intern(_make_id("fragment"))
+                session._fragment_registry[fragment_id] = (f, args, kwargs)
+
+                # Store the auto-refresh interval for this fragment.
+                # This dict persists across full reruns so the WS handler can
+                # maintain asyncio timer tasks across the session lifetime.
                 session._fragment_run_every[fragment_id] = interval_s
-
-            # Create the fragment container node and attach it to the tree.
-            container = UINode(type="fragment", id=fragment_id, props={})
-            session.current_tree.append(container)
-            session.current_tree.push_container(container)
-
-            # Execute the function — all st.* calls go into the container.
-            prev_frag = session._current_fragment_id
-            session._current_fragment_id = fragment_id
-            try:
-                result = f(*args, **kwargs)
-            finally:
-                session._current_fragment_id = prev_frag
-                session.current_tree.pop_container()
-
-            # Persist the subtree so run_fragment() can diff against it.
-            session._fragment_subtrees[fragment_id] = container
-            return result
+                return _render_fragment(session, fragment_id, f, args, kwargs)
 
         wrapper._is_fragment = True  # type: ignore[attr-defined]
         return wrapper
@@ -115,3 +112,24 @@ def fragment(func: Callable | None = None, *, run_every: Any = None) -> Callable
         return decorator(func)
     # Used as @st.fragment(...) with keyword args
     return decorator
+
+
+def _render_fragment(session: Any, fragment_id: str, f: Callable, args: tuple, kwargs: dict) -> Any:
+    """Run *f* inside a fresh fragment container and keep its subtree."""
+    # Create the fragment container node and attach it to the tree.
+    container = UINode(type="fragment", id=fragment_id, props={})
+    session.current_tree.append(container)
+    session.current_tree.push_container(container)
+
+    # Execute the function — all st.* calls go into the container.
+    prev_frag = session._current_fragment_id
+    session._current_fragment_id = fragment_id
+    try:
+        result = f(*args, **kwargs)
+    finally:
+        session._current_fragment_id = prev_frag
+        session.current_tree.pop_container()
+
+    # Persist the subtree so run_fragment() can diff against it.
+    session._fragment_subtrees[fragment_id] = container
+    return result
@@ -6,6 +6,7 @@ st.form, st.form_submit_button, st.popover, st.empty, st.divider.
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable, Sequence
@@ -20,7 +21,7 @@ from fastlit.runtime.page_discovery import (
     visible_pages,
 )
 from fastlit.runtime.navigation_slug import slugify_page_token
-from fastlit.runtime.tree import UINode
+from fastlit.runtime.tree import UINode, UITree
 from fastlit.ui.base import _make_id, _emit_node
 from fastlit.ui.text import _live_text_list_props, _live_text_props
 
@@ -29,6 +30,17 @@ from fastlit.ui.text import _live_text_list_props, _live_text_props
 # Base Container Proxy — eliminates duplicate __enter__/__exit__/__getattr__
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=1)
+def _fastlit() -> Any:
+    """Return the top-level fastlit package (cached).
+
+    Imported on first use because the package imports this module.
+    """
+    import fastlit
+
+    return fastlit
+
+
 class _ContainerProxy:
     """Base class for container context managers.
 
@@ -46,28 +58,41 @@ class _ContainerProxy:
 
     def __init__(self, node: UINode) -> None:
         self._node = node
-
-    @staticmethod
-    def _is_attached(root: UINode, target: UINode) -> bool:
-        stack = [root]
-        while stack:
-            node = stack.pop()
-            if node is target:
-                return True
-            stack.extend(node.children)
-        return False
+        # Tree the node was appended to, and the chain of nodes from that
+        # tree's root down to it. Every run (and fragment rerun) builds a
+        # fresh UITree, and st.empty() can clear any ancestor, so the node is
+        # attached while each link of the chain still holds. That is checked
+        # without walking the whole tree.
+        self._tree: UITree | None = None
+        self._path: tuple[UINode, ...] = ()
+
+    def _is_attached(self, tree: UITree) -> bool:
+        if self._tree is not tree:
+            return False
+        path = self._path
+        if not path or path[0] is not tree.root:
+            # Appended under a container entered away from its own parent;
+            # no chain to follow.
+            return _tree_contains(tree.root, self._node)
+        return all(
+            any(node is child for node in parent.children)
+            for parent, child in zip(path, path[1:])
+        )
 
     def __enter__(self):
         session = get_current_session()
         tree = session.current_tree
         if self._clear_on_enter:
             self._node.children.clear()
-        if self._append_on_enter:
+        if self._append_on_enter and not self._is_attached(tree):
             # Avoid appending the same container node multiple times, even if
             # the current container changed since first attachment.
-            already_attached = self._is_attached(tree.root, self._node)
-            if not already_attached and tree.current_container is not self._node:
+            if tree.current_container is not self._node:
                 tree.append(self._node)
+                self._path = (*_container_chain(tree), self._node)
+            else:
+                self._path = ()
+            self._tree = tree
         tree.push_container(self._node)
         return self
 
@@ -75,9 +100,7 @@ class _ContainerProxy:
         get_current_session().current_tree.pop_container()
 
     def __getattr__(self, name: str):
-        import fastlit as st
-
-        func = getattr(st, name, None)
+        func = getattr(_fastlit(), name, None)
         if func is None:
             raise AttributeError(f"{self._name} has no attribute '{name}'")
 
@@ -96,9 +119,33 @@ class _ContainerProxy:
                 if self._clear_on_call:
                     self._node.children.clear()
                 return func(*a, **kw)
+
+        # Cache on the instance: later lookups of this name (e.g. col.write
+        # in a loop) find it directly and never reach __getattr__ again.
+        self.__dict__[name] = wrapper
         return wrapper
 
 
+def _container_chain(tree: UITree) -> tuple[UINode, ...]:
+    """The open containers, down from the outermost one still linked by
+    parent-child membership to the innermost (the root if all are)."""
+    stack = tree._container_stack
+    start = len(stack) - 1
+    while start > 0 and any(node is stack[start] for node in stack[start - 1].children):
+        start -= 1
+    return tuple(stack[start:])
+
+
+def _tree_contains(root: UINode, target: UINode) -> bool:
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if node is target:
+            return True
+        stack.extend(node.children)
+    return False
+
+
 # ---------------------------------------------------------------------------
 # Sidebar
 # ---------------------------------------------------------------------------
@@ -115,29 +162,22 @@ def _get_or_create_sidebar() -> UINode:
     return node
 
 
-class _SidebarProxy:
+class _SidebarProxy(_ContainerProxy):
     """Proxy object so that both ``st.sidebar.title(...)`` and
     ``with st.sidebar:`` work like in Streamlit."""
 
-    def __enter__(self):
-        node = _get_or_create_sidebar()
-        get_current_session().current_tree.push_container(node)
-        return self
+    _append_on_enter = False  # _get_or_create_sidebar() inserts the node
+    _name = "st.sidebar"
 
-    def __exit__(self, *args):
-        get_current_session().current_tree.pop_container()
+    def __init__(self) -> None:
+        # One module-level proxy serves every session, so the node is looked
+        # up from the running session's tree rather than stored here.
+        self._tree = None
+        self._path = ()
 
-    def __getattr__(self, name: str):
-        import fastlit as st
-
-        func = getattr(st, name, None)
-        if func is None:
-            raise AttributeError(f"st.sidebar has no attribute '{name}'")
-
-        def wrapper(*a, **kw):
-            with self:
-                return func(*a, **kw)
-        return wrapper
+    @property
+    def _node(self) -> UINode:
+        return _get_or_create_sidebar()
 
 
 sidebar = _SidebarProxy()
@@ -177,6 +217,16 @@ def columns(
 
     total = sum(widths)
     cols_id = _make_id("columns", key)
+    # Build the column nodes first and hand the parent its finished child
+    # list, instead of appending them one at a time.
+    col_nodes = [
+        UINode(
+            type="column",
+            id=f"{cols_id}:col:{i}",
+            props={"width": w, "index": i, "border": border},
+        )
+        for i, w in enumerate(widths)
+    ]
     cols_node = UINode(
         type="columns",
         id=cols_id,
@@ -187,23 +237,10 @@ def columns(
             "verticalAlignment": vertical_alignment,
             "border": border,
         },
+        children=col_nodes,
     )
     session.current_tree.append(cols_node)
-    session.current_tree.push_container(cols_node)
-
-    result = []
-    for i, w in enumerate(widths):
-        col_id = f"{cols_id}:col:{i}"
-        col_node = UINode(
-            type="column",
-            id=col_id,
-            props={"width": w, "index": i, "border": border},
-        )
-        cols_node.children.append(col_node)
-        result.append(Column(col_node, cols_node))
-
-    session.current_tree.pop_container()
-    return result
+    return [Column(col_node, cols_node) for col_node in col_nodes]
 
 
 # ---------------------------------------------------------------------------
@@ -232,23 +269,18 @@ def tabs(
         default_index = labels_list.index(default)
 
     tabs_id = _make_id("tabs", key)
+    tab_nodes = [
+        UINode(type="tab", id=f"{tabs_id}:tab:{i}", props={**_live_text_props("label", label), "index": i})
+        for i, label in enumerate(labels_list)
+    ]
     tabs_node = UINode(
         type="tabs",
         id=tabs_id,
         props={**_live_text_list_props("labels", labels_list), "defaultIndex": default_index},
+        children=tab_nodes,
     )
     session.current_tree.append(tabs_node)
-    session.current_tree.push_container(tabs_node)
-
-    result = []
-    for i, label in enumerate(labels_list):
-        tab_id = f"{tabs_id}:tab:{i}"
-        tab_node = UINode(type="tab", id=tab_id, props={**_live_text_props("label", label), "index": i})
-        tabs_node.children.append(tab_node)
-        result.append(Tab(tab_node))
-
-    session.current_tree.pop_container()
-    return result
+    return [Tab(tab_node) for tab_node in tab_nodes]
 
 
 # ---------------------------------------------------------------------------
@@ -514,10 +546,32 @@ def set_sidebar_state(state: str) -> None:
 # switch_page — st.switch_page(page)
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=256)
 def _slugify_page(value: str) -> str:
     return slugify_page_token(value)
 
 
+def _page_base_dir(session: Any) -> str:
+    """Directory that relative page paths are resolved against."""
+    base_script = getattr(session, "entry_script_path", session.script_path)
+    return _entry_script_dir(str(base_script)) if base_script else str(Path.cwd())
+
+
+# Navigation resolves the same few paths on every rerun; resolve() hits
+# the filesystem, so results are cached per (directory, path).
+@functools.lru_cache(maxsize=32)
+def _entry_script_dir(base_script: str) -> str:
+    return str(Path(base_script).resolve().parent)
+
+
+@functools.lru_cache(maxsize=128)
+def _resolve_page_script(base_dir: str, path: str) -> str:
+    script_path = Path(path)
+    if not script_path.is_absolute():
+        script_path = Path(base_dir) / script_path
+    return str(script_path.resolve())
+
+
 def _normalize_template_segment(value: Any, *, allow_multiple: bool) -> list[str]:
     if allow_multiple and isinstance(value, (list, tuple, set)):
         result = [
@@ -642,14 +696,7 @@ class Page:
     def run(self) -> None:
         """Render this page inline inside the current app layout."""
         session = get_current_session()
-        script_path = Path(self.path)
-        base_script = getattr(session, "entry_script_path", session.script_path)
-        base_dir = Path(base_script).resolve().parent if base_script else Path.cwd()
-        if not script_path.is_absolute():
-            script_path = (base_dir / script_path).resolve()
-        else:
-            script_path = script_path.resolve()
-        script_path_str = str(script_path)
+        script_path_str = _resolve_page_script(_page_base_dir(session), str(self.path))
         if script_path_str in getattr(session, "_inline_rendered_scripts", set()):
             return
         session.run_inline_page_script(script_path_str)
@@ -730,8 +777,7 @@ def navigation(
     if not opts:
         return ""
 
-    base_script = getattr(session, "entry_script_path", session.script_path)
-    base_dir = Path(base_script).resolve().parent if base_script else Path.cwd()
+    base_dir = _page_base_dir(session)
     labels: list[str] = []
     icons: list[str | None] = []
     url_paths: list[str] = []
@@ -747,12 +793,7 @@ def navigation(
             url_paths.append(item.url_path if item.url_path is not None else _slugify_page(label))
             values.append(item)
 
-            script_path = Path(item.path)
-            if not script_path.is_absolute():
-                script_path = (base_dir / script_path).resolve()
-            else:
-                script_path = script_path.resolve()
-            page_scripts[i] = str(script_path)
+            page_scripts[i] = _resolve_page_script(base_dir, str(item.path))
 
             if item.default and default_idx == 0:
                 default_idx = i
@@ -79,6 +79,8 @@ interface SelectedCell {
 interface DataFrameProps {
   columns: Column[];
   rows: any[][];
+  layout?: string;
+  columnData?: any[][];
   arrowData?: string;
   dataTransport?: string;
   index?: any[];
@@ -230,6 +232,13 @@ function normalizeRows(rows: any[][], indexValues?: any[], positions?: number[])
     : [];
 }
 
+function columnsToRows(columnData: any[][]): any[][] {
+  const rowCount = columnData.reduce((max, values) => Math.max(max, Array.isArray(values) ? values.length : 0), 0);
+  return Array.from({ length: rowCount }, (_, rowIndex) =>
+    columnData.map((values) => (Array.isArray(values) ? values[rowIndex] ?? null : null))
+  );
+}
+
 function decodeBase64ToUint8Array(value: string): Uint8Array {
   const binary = window.atob(value);
   const bytes = new Uint8Array(binary.length);
@@ -363,6 +372,8 @@ export const DataFrame: React.FC<NodeComponentProps> = ({ nodeId, props, sendEve
   const {
     columns = [],
     rows = [],
+    layout,
+    columnData,
     arrowData,
     index,
     positions,
@@ -424,7 +435,12 @@ export const DataFrame: React.FC<NodeComponentProps> = ({ nodeId, props, sendEve
     }
   }, [arrowData, columns]);
 
-  const initialRows = decodedPreview?.rows ?? rows;
+  const columnarRows = useMemo(() => {
+    if (layout !== "columnar" || !Array.isArray(columnData)) return null;
+    return columnsToRows(columnData);
+  }, [layout, columnData]);
+
+  const initialRows = decodedPreview?.rows ?? columnarRows ?? rows;
   const initialIndex = decodedPreview?.index ?? index;
   const initialPositions = decodedPreview?.positions ?? positions;
 